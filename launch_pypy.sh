@@ -0,0 +1,17 @@
+#!/bin/sh
+# Runs the Flet GUI under PyPy, whose JIT speeds up the view/card building code.
+# The backend (pdfplumber, mysql-connector) stays on CPython.
+#
+# Usage: ./launch_pypy.sh    (PYTHON / PYPY override the interpreters)
+set -e
+cd "$(dirname "$0")"
+
+PYTHON=${PYTHON:-python}
+PYPY=${PYPY:-pypy3}
+export PYTHONPATH="$PWD:$PWD/src${PYTHONPATH:+:$PYTHONPATH}"
+
+(cd src && exec "$PYTHON" -c "from main import start_backend; start_backend()") &
+BACKEND_PID=$!
+trap 'kill $BACKEND_PID 2>/dev/null' EXIT INT TERM
+
+"$PYPY" -m src.ui.flet_frontend
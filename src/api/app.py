@@ -1,7 +1,10 @@
+import gzip
+import hmac
+import json
 import threading
 import sys
 import os
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, Response, request, jsonify, send_file
 
 
 from src.core.search_service import SearchService
@@ -34,6 +37,20 @@ search_service = SearchService(cv_data_store=cv_data_store, db_manager=database_
 parser_thread = None
 parsing_started = False
 
+# Set by /shutdown; the process hosting the server waits on it to exit cleanly
+shutdown_requested = threading.Event()
+
+# Seconds between keep-alive comments on an idle /status/stream
+STATUS_STREAM_KEEPALIVE = 15
+
+# Each open /status/stream holds one of waitress's 8 threads for the whole
+# parse, so only a few may be open at once; extra clients fall back to polling.
+MAX_STATUS_STREAMS = 2
+status_stream_slots = threading.BoundedSemaphore(MAX_STATUS_STREAMS)
+
+# JSON bodies smaller than this are sent uncompressed
+GZIP_MIN_SIZE = 1024
+
 
 def ensure_parsing_started():
     """Ensure background parsing is started (called on first request)."""
@@ -49,13 +66,76 @@ def ensure_parsing_started():
         parsing_started = True
 
 
+@app.after_request
+def gzip_json_response(response):
+    """Gzip larger JSON bodies (search results, summaries) for clients that accept it."""
+    if (
+        response.direct_passthrough
+        or response.is_streamed
+        or response.status_code != 200
+        or response.mimetype != "application/json"
+        or "Content-Encoding" in response.headers
+        or "gzip" not in request.accept_encodings
+    ):
+        return response
+
+    data = response.get_data()
+    if len(data) < GZIP_MIN_SIZE:
+        return response
+
+    response.set_data(gzip.compress(data, compresslevel=5))
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
 # --- API Endpoints ---
 
 
 @app.route("/status", methods=["GET"])
 def get_status():
     ensure_parsing_started()  # Start parsing on first request
-    return jsonify(cv_data_store.get_status())
+    status = cv_data_store.get_status()
+    response = jsonify(status)
+    # Lets pollers send If-None-Match and get an empty 304 while nothing changed
+    response.set_etag(
+        f"{status['parsed_count']}/{status['total_count']}/{int(status['is_done'])}",
+        weak=True,
+    )
+    return response.make_conditional(request)
+
+
+@app.route("/status/stream", methods=["GET"])
+def stream_status():
+    """Pushes the parsing status as Server-Sent Events until parsing is done."""
+    ensure_parsing_started()
+    if not status_stream_slots.acquire(blocking=False):
+        return jsonify({"error": "Too many status streams"}), 503
+
+    def events():
+        version = -1
+        while True:
+            new_version = cv_data_store.wait_for_status_change(
+                version, timeout=STATUS_STREAM_KEEPALIVE
+            )
+            if new_version == version:
+                # Nothing changed; keep proxies and the client from timing out
+                yield ": keep-alive\n\n"
+                continue
+            version = new_version
+            status = cv_data_store.get_status()
+            yield f"data: {json.dumps(status)}\n\n"
+            if status["is_done"]:
+                return
+
+    response = Response(
+        events(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+    # Runs even if the client drops before the first event is sent
+    response.call_on_close(status_stream_slots.release)
+    return response
 
 
 @app.route("/search", methods=["POST"])
@@ -154,6 +234,23 @@ def search_multiple_patterns():
     return jsonify(response)
 
 
+@app.route("/shutdown", methods=["POST"])
+def shutdown():
+    """Ask the hosting process to stop the server once this response is sent.
+
+    Requires the per-launch token main.py hands to the backend process, so a
+    web page in the user's browser can't POST here and kill the backend.
+    """
+    expected = app.config.get("SHUTDOWN_TOKEN")
+    provided = request.headers.get("X-Shutdown-Token", "")
+    if not expected or not hmac.compare_digest(provided, expected):
+        return jsonify({"error": "Forbidden"}), 403
+
+    response = jsonify({"status": "shutting down"})
+    response.call_on_close(shutdown_requested.set)
+    return response
+
+
 if __name__ == "__main__":
     from config import API_HOST, API_PORT
 
@@ -1,7 +1,10 @@
 # src/core/cv_data_store.py
 
+import logging
 import threading
 
+logger = logging.getLogger(__name__)
+
 
 class CVDataStore:
     def __init__(self):
@@ -14,6 +17,10 @@ class CVDataStore:
 
         self._lock = threading.Lock()
 
+        # Bumped on every update_status so /status/stream can wait for changes
+        self._status_version = 0
+        self._status_changed = threading.Condition(self._lock)
+
         self.parsing_complete_event = threading.Event()
 
     def add_cv(
@@ -36,7 +43,7 @@ class CVDataStore:
 
     def get_status(self) -> dict:
         with self._lock:
-            print(f"[CVDataStore] get_status() INSIDE lock: _parsing_status = {self._parsing_status}")
+            logger.debug("get_status() INSIDE lock: _parsing_status = %s", self._parsing_status)
             
             progress = self._parsing_status["progress"]
             total = self._parsing_status["total"]
@@ -56,7 +63,9 @@ class CVDataStore:
             }
         
         # Debug logging
-        print(f"[CVDataStore] get_status() returning: parsed={progress}, total={total}, is_done={is_done}")
+        logger.debug(
+            "get_status() returning: parsed=%s, total=%s, is_done=%s", progress, total, is_done
+        )
         
         return status
 
@@ -71,3 +80,19 @@ class CVDataStore:
                     f"[CVDataStore] Background parsing has completed ({progress}/{total}). Setting completion event."
                 )
                 self.parsing_complete_event.set()
+
+        # Notify after the completion event is set so waiters see is_done
+        with self._status_changed:
+            self._status_version += 1
+            self._status_changed.notify_all()
+
+    def wait_for_status_change(self, last_version: int, timeout: float) -> int:
+        """Blocks until the status moves past last_version or timeout expires.
+
+        Returns the current version; it equals last_version on a timeout.
+        """
+        with self._status_changed:
+            self._status_changed.wait_for(
+                lambda: self._status_version != last_version, timeout=timeout
+            )
+            return self._status_version
@@ -1,5 +1,6 @@
 import mysql.connector
-from typing import List
+import threading
+from typing import List, Optional, Tuple
 from models import Applicant, Application
 
 class DatabaseManager:
@@ -19,29 +20,70 @@ class DatabaseManager:
                 database=database
             )
             self.cursor = self.conn.cursor(dictionary=True)
+            # The connection and cursor are shared by every server thread (and
+            # the background parser) and aren't thread-safe; one query at a time
+            self._lock = threading.Lock()
 
     def get_all_applicants(self) -> List[Applicant]:
-        self.cursor.execute("SELECT * FROM ApplicantProfile")
-        rows = self.cursor.fetchall()
-        return [Applicant(**row) for row in rows]
+        with self._lock:
+            self.cursor.execute("SELECT * FROM ApplicantProfile")
+            rows = self.cursor.fetchall()
+            return [Applicant(**row) for row in rows]
 
     def get_all_applications(self) -> List[Application]:
-        self.cursor.execute("SELECT * FROM ApplicationDetail")
-        rows = self.cursor.fetchall()
-        return [Application(**row) for row in rows]
+        with self._lock:
+            self.cursor.execute("SELECT * FROM ApplicationDetail")
+            rows = self.cursor.fetchall()
+            return [Application(**row) for row in rows]
     
     def get_applicant_by_id(self, applicant_id: int) -> Applicant:
-        self.cursor.execute("SELECT * FROM ApplicantProfile WHERE applicant_id = %s", (applicant_id,))
-        row = self.cursor.fetchone()
-        return Applicant(**row) if row else None
+        with self._lock:
+            self.cursor.execute("SELECT * FROM ApplicantProfile WHERE applicant_id = %s", (applicant_id,))
+            row = self.cursor.fetchone()
+            return Applicant(**row) if row else None
     
     def get_applications_id(self, applicant_id: int) -> List[Application]:
-        self.cursor.execute("SELECT * FROM ApplicationDetail WHERE applicant_id = %s", (applicant_id,))
-        rows = self.cursor.fetchall()
-        return [Application(**row) for row in rows]
+        with self._lock:
+            self.cursor.execute("SELECT * FROM ApplicationDetail WHERE applicant_id = %s", (applicant_id,))
+            rows = self.cursor.fetchall()
+            return [Application(**row) for row in rows]
+
+    def count_applicants(self) -> int:
+        with self._lock:
+            self.cursor.execute("SELECT COUNT(*) AS total FROM ApplicantProfile")
+            return self.cursor.fetchone()["total"]
+
+    def count_applications(self) -> int:
+        with self._lock:
+            self.cursor.execute("SELECT COUNT(*) AS total FROM ApplicationDetail")
+            return self.cursor.fetchone()["total"]
+
+    def get_applicants_with_applications(self, limit: int = 10) -> List[Tuple[Applicant, Optional[Application]]]:
+        with self._lock:
+            self.cursor.execute(
+                "SELECT a.*, d.detail_id, d.application_role, d.cv_path "
+                "FROM ApplicantProfile a "
+                "LEFT JOIN ApplicationDetail d ON d.applicant_id = a.applicant_id "
+                "ORDER BY a.applicant_id LIMIT %s",
+                (limit,),
+            )
+            results = []
+            for row in self.cursor.fetchall():
+                detail_id = row.pop("detail_id")
+                application_role = row.pop("application_role")
+                cv_path = row.pop("cv_path")
+                applicant = Applicant(**row)
+                application = (
+                    Application(detail_id, applicant.applicant_id, application_role, cv_path)
+                    if detail_id is not None
+                    else None
+                )
+                results.append((applicant, application))
+            return results
 
     def close(self):
-        if self.conn.is_connected():
-            self.cursor.close()
-            self.conn.close()
-            DatabaseManager._instance = None 
+        with self._lock:
+            if self.conn.is_connected():
+                self.cursor.close()
+                self.conn.close()
+                DatabaseManager._instance = None 
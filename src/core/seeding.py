@@ -1,20 +1,28 @@
 from faker import Faker
+from faker.providers.person.en import Provider as PersonProvider
+from multiprocessing import Pool
+import csv
+import datetime
 import os
 import random
 
-fake = Faker()
+# Plain name tuples from the provider; sampling these directly skips
+# Faker's per-call provider dispatch.
+FIRST_NAMES = PersonProvider.first_names
+LAST_NAMES = PersonProvider.last_names
+DIGITS = "0123456789"
 
-# Scan data directory for all PDFs
-data_dir = "../../data"
-all_cv_files = []
-for file in os.listdir(data_dir):
-    if file.endswith(".pdf"):
-        all_cv_files.append(file)
+# Addresses are the only field still generated by Faker, so build a pool once.
+# Below the threshold, spawning workers costs more than generating in-process.
+PARALLEL_ADDRESS_THRESHOLD = 5000
+ADDRESS_CHUNK_SIZE = 250
+ADDRESS_CLEANUP = str.maketrans({"\n": ", "})
 
-print(f"Found {len(all_cv_files)} PDFs in data directory")
+# Output buffer for the generated files (1 MiB)
+WRITE_BUFFER_SIZE = 1024 * 1024
 
 # List of roles
-roles = [
+roles = (
     "ACCOUNTANT",
     "ADVOCATE",
     "BUSINESS-DEVELOPMENT",
@@ -27,18 +35,71 @@ roles = [
     "INFORMATION-TECHNOLOGY",
     "SALES",
     "TEACHER",
-]
+)
 
+# Per-process Faker instance, created by _init_worker
+fake = None
 
-sql_file_path = "../database/database.sql"
-with open(sql_file_path, "w") as f:
-    # Write database structure
-    f.write("DROP DATABASE IF EXISTS cvApplicationDatabase;\n")
-    f.write("CREATE DATABASE cvApplicationDatabase;\n")
-    f.write("USE cvApplicationDatabase;\n\n")
 
-    f.write(
-        """
+def _init_worker():
+    global fake
+    fake = Faker()
+
+
+def _generate_addresses(count):
+    return [fake.address().translate(ADDRESS_CLEANUP) for _ in range(count)]
+
+
+def build_address_pool(size):
+    """Generate Faker addresses, in parallel for large pools."""
+    if size < PARALLEL_ADDRESS_THRESHOLD:
+        _init_worker()
+        return _generate_addresses(size)
+
+    # One Faker instance per worker
+    chunks = [ADDRESS_CHUNK_SIZE] * (size // ADDRESS_CHUNK_SIZE)
+    if size % ADDRESS_CHUNK_SIZE:
+        chunks.append(size % ADDRESS_CHUNK_SIZE)
+
+    with Pool(initializer=_init_worker) as pool:
+        return [
+            address
+            for chunk in pool.imap_unordered(_generate_addresses, chunks)
+            for address in chunk
+        ]
+
+
+def main():
+    # Scan data directory for all PDFs
+    data_dir = "../../data"
+    all_cv_files = []
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".pdf") and entry.is_file(follow_symlinks=False):
+                all_cv_files.append(entry.name)
+
+    print(f"Found {len(all_cv_files)} PDFs in data directory")
+
+    # Sized to the applicant count, so small data sets skip the extra work
+    address_pool = build_address_pool(len(all_cv_files))
+
+    sql_file_path = "../database/database.sql"
+    constraints_file_path = "../database/constraints.sql"
+    applicants_csv_path = "../database/applicants.csv"
+    applications_csv_path = "../database/applications.csv"
+    with open(
+        sql_file_path, "w", buffering=WRITE_BUFFER_SIZE, encoding="utf-8", newline="\n"
+    ) as f:
+        # Write database structure
+        f.write("DROP DATABASE IF EXISTS cvApplicationDatabase;\n")
+        f.write("CREATE DATABASE cvApplicationDatabase;\n")
+        f.write("USE cvApplicationDatabase;\n\n")
+
+        # The ApplicationDetail foreign key goes into constraints.sql, which
+        # setupDatabase runs after the CSV load, so the bulk load neither
+        # validates it nor maintains its index row by row.
+        f.write(
+            """
 CREATE TABLE ApplicantProfile (
     applicant_id INT AUTO_INCREMENT PRIMARY KEY,
     first_name VARCHAR(50),
@@ -52,39 +113,62 @@ CREATE TABLE ApplicationDetail (
     detail_id INT AUTO_INCREMENT PRIMARY KEY,
     applicant_id INT,
     application_role VARCHAR(100) DEFAULT NULL,
-    cv_path TEXT,
-    FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id)
+    cv_path TEXT
 );
 
 """
-    )
-
-
-    f.write("-- INSERT INTO ApplicantProfile\n")
-    for i, cv_file in enumerate(all_cv_files):
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        dob = fake.date_of_birth(minimum_age=21, maximum_age=35)
-        address = fake.address().replace("\n", ", ").replace("'", "''")  
-        phone = "08" + "".join(fake.random_choices(elements="0123456789", length=10))
+        )
 
+    with open(constraints_file_path, "w", encoding="utf-8", newline="\n") as f:
         f.write(
-            f"INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) "
-            f"VALUES ('{first_name}', '{last_name}', '{dob}', '{address}', '{phone}');\n"
+            """ALTER TABLE ApplicationDetail ADD CONSTRAINT fk_app
+    FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id);
+"""
         )
 
-    f.write("\n-- INSERT INTO ApplicationDetail\n")
-    for i, cv_file in enumerate(all_cv_files):
-        applicant_id = i + 1
-        random_role = random.choice(roles)
-
+    # Seed rows are written as CSV and bulk-loaded by setupDatabase.load_csv_files
+    today = datetime.date.today()
+    with open(
+        applicants_csv_path,
+        "w",
+        buffering=WRITE_BUFFER_SIZE,
+        encoding="utf-8",
+        newline="",
+    ) as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerows(
+            (
+                random.choice(FIRST_NAMES),
+                random.choice(LAST_NAMES),
+                today - datetime.timedelta(days=random.randint(21 * 365, 35 * 365)),
+                random.choice(address_pool),
+                "08" + "".join(random.choices(DIGITS, k=10)),
+            )
+            for _ in all_cv_files
+        )
 
-        f.write(
-            f"INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) "
-            f"VALUES ({applicant_id}, '{random_role}', '{cv_file}');\n"
+    with open(
+        applications_csv_path,
+        "w",
+        buffering=WRITE_BUFFER_SIZE,
+        encoding="utf-8",
+        newline="",
+    ) as f:
+        # Draw every role in one call instead of one random.choice per row
+        role_pool = random.choices(roles, k=len(all_cv_files))
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerows(
+            (applicant_id, role, cv_file)
+            for applicant_id, (role, cv_file) in enumerate(
+                zip(role_pool, all_cv_files), start=1
+            )
         )
 
-print("Fresh SQL file generated!")
-print(f"- Created {len(all_cv_files)} applicants")
-print(f"- Created {len(all_cv_files)} applications")
-print(f"- All CV paths are just filenames")
+    print("Fresh SQL schema and CSV seed files generated!")
+    print(f"- Created {len(all_cv_files)} applicants")
+    print(f"- Created {len(all_cv_files)} applications")
+    print(f"- All CV paths are just filenames")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,17 @@
 import mysql.connector
+from mysql.connector.constants import ClientFlag
 import os
 
+# (nama file CSV, tabel tujuan, kolom) untuk LOAD DATA
+CSV_LOADS = (
+    (
+        "applicants.csv",
+        "ApplicantProfile",
+        "(first_name, last_name, date_of_birth, address, phone_number)",
+    ),
+    ("applications.csv", "ApplicationDetail", "(applicant_id, application_role, cv_path)"),
+)
+
 def create_database_if_not_exists(cursor, db_name):
     cursor.execute(f"CREATE DATABASE IF NOT EXISTS {db_name};")
     print(f"Database '{db_name}' dicek / dibuat.")
@@ -8,30 +19,59 @@ def create_database_if_not_exists(cursor, db_name):
 def execute_sql_file(cursor, sql_file_path):
     with open(sql_file_path, 'r', encoding='utf-8') as file:
         sql = file.read()
-        # Eksekusi per statement (dipisah dengan ;)
-        for statement in sql.split(';'):
-            stmt = statement.strip()
-            if stmt:
-                try:
-                    cursor.execute(stmt)
-                except Exception as e:
-                    print(f"Gagal eksekusi statement: {stmt[:100]}...\n{e}")
-
-def setup_database(host, user, password, db_name, sql_path):
+    # Kirim seluruh file sekaligus; server yang memecah statement-nya
+    for result in cursor.execute(sql, multi=True):
+        if result.with_rows:
+            result.fetchall()
+
+def load_csv_files(cursor, csv_dir):
+    # Bulk load hasil seeding.py; file yang tidak ada dilewati
+    for file_name, table, columns in CSV_LOADS:
+        csv_path = os.path.abspath(os.path.join(csv_dir, file_name))
+        if not os.path.exists(csv_path):
+            print(f"File CSV tidak ditemukan, dilewati: {csv_path}")
+            continue
+        cursor.execute(
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {table} "
+            "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+            f"LINES TERMINATED BY '\\n' {columns}",
+            (csv_path,),
+        )
+        print(f"{cursor.rowcount} baris dimuat ke {table}.")
+
+def setup_database(
+    host, user, password, db_name, sql_path, csv_dir=None, post_load_sql_path=None
+):
     try:
         print("Menghubungkan ke MySQL...")
         conn = mysql.connector.connect(
             host=host,
             user=user,
-            password=password
+            password=password,
+            client_flags=[ClientFlag.MULTI_STATEMENTS],
+            allow_local_infile=csv_dir is not None,
         )
         cursor = conn.cursor()
         create_database_if_not_exists(cursor, db_name)
 
         cursor.execute(f"USE {db_name};")
+
+        # Satu transaksi untuk seluruh load, tanpa cek unique/foreign key
+        cursor.execute("SET autocommit=0")
+        cursor.execute("SET unique_checks=0")
+        cursor.execute("SET foreign_key_checks=0")
+
         execute_sql_file(cursor, sql_path)
+        if csv_dir is not None:
+            load_csv_files(cursor, csv_dir)
+        # Constraint (foreign key + index) dipasang setelah data dimuat
+        if post_load_sql_path is not None:
+            execute_sql_file(cursor, post_load_sql_path)
 
         conn.commit()
+        cursor.execute("SET foreign_key_checks=1")
+        cursor.execute("SET unique_checks=1")
+        cursor.execute("SET autocommit=1")
         cursor.close()
         conn.close()
 
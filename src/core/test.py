@@ -1,6 +1,6 @@
+import os
 from getpass import getpass
 from databaseManager import DatabaseManager
-from models import Applicant, Application
 from setupDatabase import setup_database
 
 
@@ -12,6 +12,14 @@ def main():
     try:
         DB_NAME = "cvApplicationDatabase"
         SQL_FILE = "../database/tubes3_seeding.sql"
+        CSV_DIR = None
+        POST_LOAD_SQL = None
+
+        # seeding.py menulis schema database.sql + CSV; pakai itu kalau ada
+        if os.path.exists("../database/applicants.csv"):
+            SQL_FILE = "../database/database.sql"
+            CSV_DIR = "../database"
+            POST_LOAD_SQL = "../database/constraints.sql"
 
         setup_database(
             host="localhost",
@@ -19,21 +27,19 @@ def main():
             password=password,
             db_name=DB_NAME,
             sql_path=SQL_FILE,
+            csv_dir=CSV_DIR,
+            post_load_sql_path=POST_LOAD_SQL,
         )
 
         db = DatabaseManager(user=user, password=password)
 
-        applicants = db.get_all_applicants()
-        applications = db.get_all_applications()
-
-        print(f"\nJumlah Pelamar: {len(applicants)}")
-        print(f"Jumlah Lamaran (ApplicationDetail): {len(applications)}")
+        print(f"\nJumlah Pelamar: {db.count_applicants()}")
+        print(f"Jumlah Lamaran (ApplicationDetail): {db.count_applications()}")
 
         print("\nDaftar Pelamar dan CV Path:")
-        app_map = {app.applicant_id: app for app in applications}
+        preview = db.get_applicants_with_applications(limit=10)
 
-        for a in applicants[:10]:
-            app = app_map.get(a.applicant_id)
+        for a, app in preview:
             cv_filename = app.cv_path if app else "Tidak ada"
             full_cv_path = (
                 f"data/{cv_filename}"
@@ -50,8 +56,8 @@ def main():
 
         # Test path construction
         print("🧪 Testing path construction:")
-        if applications:
-            test_app = applications[0]
+        test_app = next((app for _, app in preview if app), None)
+        if test_app:
             print(f"Database stores: '{test_app.cv_path}'")
             print(f"App will use: 'data/{test_app.cv_path}'")
 
@@ -1,985 +0,0 @@
-DROP DATABASE IF EXISTS cvApplicationDatabase;
-CREATE DATABASE cvApplicationDatabase;
-USE cvApplicationDatabase;
-
-
-CREATE TABLE ApplicantProfile (
-    applicant_id INT AUTO_INCREMENT PRIMARY KEY,
-    first_name VARCHAR(50),
-    last_name VARCHAR(50),
-    date_of_birth DATE,
-    address VARCHAR(255),
-    phone_number VARCHAR(20)
-);
-
-CREATE TABLE ApplicationDetail (
-    detail_id INT AUTO_INCREMENT PRIMARY KEY,
-    applicant_id INT,
-    application_role VARCHAR(100) DEFAULT NULL,
-    cv_path TEXT,
-    FOREIGN KEY (applicant_id) REFERENCES ApplicantProfile(applicant_id)
-);
-
--- INSERT INTO ApplicantProfile
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rose', 'Schmidt', '2003-11-13', '11475 Hill Manor Suite 917, Port Jessicabury, NY 48642', '082068052548');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Eric', 'Ponce', '1998-09-15', '1330 Jackson Roads Apt. 414, Morganside, IL 24798', '089902930365');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jeffrey', 'Lewis', '1994-10-06', '5571 Cheryl Port, South Oliviachester, WY 17936', '088066760870');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Julian', 'Hicks', '1998-04-22', '51373 Marshall Junction Suite 619, South Tylerburgh, NC 47131', '083571462541');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Dustin', 'Stein', '1998-02-01', '761 Robert Circles, Michaelview, OR 56439', '084460876635');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('James', 'Newman', '2000-12-17', '735 Molly Course, South Meganberg, FL 18279', '089100998985');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Joan', 'Lee', '2000-11-14', '485 Mackenzie Dam Suite 946, New Eddiefurt, OR 65890', '089616840202');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Scott', 'Garcia', '1999-07-11', '26477 Tracy Spurs, Tammyview, MT 46344', '088859774771');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Joel', 'Reyes', '1992-06-05', '230 Cunningham Overpass, West Alexandraborough, MO 48884', '089989404318');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Larry', 'Baker', '1994-06-18', '913 Beth Keys, East Joanne, RI 86051', '083226470810');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Bruce', 'Francis', '1990-04-20', '7282 Warren Mountains Apt. 584, Aliciatown, ME 18332', '088363087122');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sheryl', 'Roach', '1992-10-15', '420 Miranda Stream, North Kelly, VA 38025', '080262594092');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Christine', 'Jones', '2000-11-05', '62285 Tina Springs, New Annette, DE 47758', '084301830127');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kimberly', 'Russell', '1993-11-24', '199 Justin Islands, Whiteborough, CT 73965', '081253377699');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Patricia', 'Lopez', '1996-01-04', '3775 Wilson Mountain, Melissamouth, KS 67915', '085070765092');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Laura', 'Stokes', '2002-11-17', '10090 George Skyway Suite 172, Lake Jamesshire, MN 18431', '089770138865');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Tammy', 'Shaw', '2003-07-15', '416 Donald Shores Suite 710, Anthonyport, NE 85324', '084780923930');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Regina', 'Rose', '1994-06-07', '65111 Elizabeth Dale, Lucaschester, AK 75187', '082495372650');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Darrell', 'Bowers', '1996-05-03', '624 Bailey Points, Collinsborough, VA 52548', '084239425979');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Molly', 'Hall', '1999-08-24', 'PSC 2834, Box 2740, APO AA 00926', '085556374531');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Emily', 'Rose', '1994-03-06', '6702 Christopher Skyway, Gonzalezland, AR 14196', '086881007114');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kimberly', 'Walker', '1994-01-21', 'Unit 1362 Box 1833, DPO AA 22858', '087918308891');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Robert', 'Hess', '1998-12-07', '2305 Arias Lane, Lisahaven, SC 08640', '088504336510');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Patricia', 'Wheeler', '1990-08-04', 'PSC 9554, Box 7378, APO AA 95550', '081589353960');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Linda', 'Ferguson', '1997-07-15', '436 Christopher Via, Lake Mason, GA 49473', '088966352405');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('James', 'Guerrero', '1998-11-28', '988 Castillo Mountain, Williamsburgh, NC 51417', '089735324135');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Erica', 'Pierce', '1990-01-06', '7489 Briggs Fall Suite 509, Mooretown, SD 08077', '084539074745');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lawrence', 'Robinson', '1990-11-09', '225 Hunter Stream Suite 057, Krystalton, CT 89087', '084934091619');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Christy', 'Frost', '1995-12-12', '159 Taylor Mills, Roberthaven, VI 48445', '082284120797');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Joseph', 'Stewart', '1998-06-12', 'Unit 6137 Box 9628, DPO AE 68418', '084763774230');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('David', 'Harris', '1998-08-17', '865 Bonilla Circle Apt. 071, New Jessicaview, NH 88621', '087731031125');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jason', 'Simmons', '2004-05-31', '0094 Villanueva Prairie, Roberttown, LA 79611', '089092892889');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Larry', 'Howell', '1997-12-11', '30099 Ray Ridges, Webbmouth, TN 95121', '085297333812');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Adrienne', 'Nguyen', '2003-06-08', '217 Perry Branch, North Josephborough, VT 25186', '081829070697');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('William', 'Leonard', '1997-08-17', '6683 Stewart Court, South Cindy, IN 52189', '083944484767');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Donald', 'Ramirez', '1992-05-05', '2050 David Drive Suite 141, Natashashire, KS 17807', '082892409320');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Tony', 'Molina', '1998-12-22', '5378 Peter Haven, Scottshire, VI 18235', '088893961338');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('David', 'Sweeney', '1990-07-05', '6204 Hughes Row Apt. 603, Port Derek, DC 73548', '083289159545');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Heather', 'Petersen', '1998-10-12', '678 Jones Roads Suite 764, Port Christineville, ME 99366', '083037295604');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Brian', 'Robinson', '1989-12-09', '3695 Palmer Ford Suite 467, Robertsview, MA 04051', '087415870023');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Steven', 'Wagner', '2001-09-19', 'Unit 0682 Box 9201, DPO AP 03407', '086409498426');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Tabitha', 'Norton', '2003-01-23', '634 Donovan Cape, North Davidborough, ID 26351', '084081982829');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jeffrey', 'Olson', '1998-06-16', '09556 Kimberly Springs, Bethtown, HI 11651', '081049881046');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Christopher', 'Bernard', '1992-04-05', '937 Sutton Ridges Suite 191, Port Kathleenstad, MA 52436', '088089333211');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jacqueline', 'Charles', '1992-12-25', 'USNS Johnson, FPO AA 49231', '081559174212');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Emily', 'Henry', '1996-08-17', '403 Matthew Extensions, Sarahport, KY 30833', '084131902674');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kim', 'Edwards', '1999-02-17', '9069 Walker Avenue, North Jennifermouth, CO 72663', '085334519946');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Thomas', 'Hudson', '1998-10-22', '979 Garrett Falls Suite 380, Marvinport, OH 48703', '084294259066');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Thomas', 'Hardin', '1991-08-21', '87889 Jerry Freeway Apt. 071, West Carmen, UT 84510', '087574348996');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rachel', 'Murphy', '1999-09-03', '05263 Jessica Club, West Sophiaville, MP 06004', '086336928265');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Curtis', 'Bennett', '1998-01-09', 'USS Wolf, FPO AP 03529', '085324427920');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Melvin', 'Estrada', '1996-10-27', '134 Jason Vista Suite 573, East Peterberg, AR 15247', '083243296728');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Matthew', 'Spears', '1995-03-25', '6837 Thompson Square Apt. 140, Acostastad, DC 77151', '089891833003');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jamie', 'Patterson', '1991-10-08', '1506 Destiny Underpass Apt. 135, Fieldstown, VT 73059', '086500501572');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jacob', 'Diaz', '1995-01-20', '1973 Bennett Park, East Susan, MD 01054', '082263327579');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michael', 'Bush', '2001-10-09', '0852 Peterson Manors Apt. 251, Reyesview, MI 28737', '089453104859');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Roberto', 'Lee', '2000-11-05', '18656 Malone Lock, South Isaiah, GU 07602', '088362614656');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Bradley', 'Lee', '1998-03-06', '5084 Cummings Vista, Jeffreyview, ME 18084', '080546813889');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Shari', 'Graham', '1992-07-26', '955 Scott Flat Apt. 317, New James, NM 68819', '082777464745');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Tony', 'Wallace', '2001-03-28', 'PSC 2478, Box 1270, APO AP 44941', '084867813105');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Patricia', 'Mccormick', '1992-10-10', '6619 Palmer Pine Apt. 924, Martinbury, FL 73784', '084714150042');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Alicia', 'Smith', '1994-08-15', '0736 Vicki Gateway, Port Davidmouth, OK 55603', '089192218286');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Dillon', 'Leon', '1993-10-15', '633 Avila Station, Port Angela, AK 12260', '081981274910');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Seth', 'Evans', '2002-04-22', '0974 Susan Pike Suite 857, Riceburgh, HI 96523', '081799521558');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Colleen', 'Gates', '1999-08-02', '218 Bishop Gardens Suite 941, Aguilarborough, NJ 89336', '083704933974');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Adam', 'Griffith', '2001-12-08', '9703 Jennifer Ways, Laurashire, GA 95987', '083914614785');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Wendy', 'Andersen', '1997-08-31', '3303 Kyle Canyon Apt. 140, East James, ND 47614', '083292507441');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Philip', 'Boyle', '1998-11-24', '0919 Singh Cape, Davidchester, NV 90065', '089802879701');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Arthur', 'Colon', '1997-04-21', '672 Chavez Ville Suite 130, North Kelly, AZ 02877', '081245598542');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Whitney', 'Pollard', '1989-07-08', '06371 Barbara Crest, West Scott, WV 33370', '089092965101');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Zachary', 'Merritt', '1998-11-05', '2868 Clark Harbors Suite 006, Port Kellyborough, PW 59795', '089627683237');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Justin', 'Daugherty', '2000-07-31', 'Unit 3376 Box 3059, DPO AA 92611', '082204433659');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Joseph', 'Jacobs', '1994-02-08', 'PSC 7484, Box 8295, APO AP 63179', '087274930081');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Samuel', 'Cooper', '1994-05-24', '10618 Bianca Green Apt. 918, Scottland, MA 17561', '085111505195');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Heather', 'Clark', '1994-07-10', '516 Sara Lock Apt. 386, Audreytown, VA 40745', '084363354479');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Matthew', 'Berry', '1993-08-02', '349 Morris Wells, New Mikeport, ME 75177', '080478247079');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Daniel', 'Trevino', '2000-09-04', '5265 Gordon Ways, Andersontown, IN 35656', '083951515719');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rachel', 'Branch', '2003-08-08', '609 Patterson Shore, Gardnerburgh, IN 82922', '089968944746');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Monique', 'Hess', '2003-05-03', '71194 Nicholas Via Apt. 049, South Melissa, IN 97875', '083944641542');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('David', 'Hayden', '1995-03-26', '72823 Rodriguez Knolls, Robertsbury, MN 80866', '084916337142');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Stacy', 'Kidd', '1991-05-22', '875 Tommy Circle, North Patricia, GA 28791', '087018629364');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Brittany', 'Santana', '1999-12-08', '3075 Kelly Trafficway, Goldenborough, AS 83407', '087411525852');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('David', 'Barrett', '1993-03-03', '58555 Rose Gardens Suite 598, Teresafort, PR 89638', '085301122620');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Christina', 'Powers', '2004-05-28', '72816 Simmons Trafficway Apt. 534, Stevenburgh, CA 40471', '086207742761');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Bailey', 'Hodges', '2002-09-13', '4644 Thomas Village Apt. 392, South Markburgh, PA 25654', '083440891554');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Christine', 'Jackson', '1993-01-02', '44215 Robinson Wall, East Stevenstad, OH 25607', '080826929695');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sherri', 'Anderson', '1995-09-02', 'USNV Cox, FPO AA 19331', '081104888474');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jennifer', 'Meza', '1993-08-05', '034 Jonathan Ways, Lake Jocelyn, GU 18927', '081621333814');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Tara', 'Peters', '1991-08-28', '8033 Robert Cove, West Paulview, OK 92830', '086131423823');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rebecca', 'Velez', '1994-10-12', '204 David Field, Gordonfurt, NV 24719', '080278366051');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Eric', 'Snow', '1992-06-02', '10696 Kristin Park, East Kristen, VI 95595', '085082861624');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sara', 'Porter', '1990-04-13', '1348 Elizabeth Terrace, Walkerburgh, CO 88833', '087340835070');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Mary', 'Douglas', '1989-06-15', '047 Osborne Fields Suite 479, South Lindsaymouth, CT 92665', '081407248167');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Amy', 'Cantrell', '1998-04-22', '546 Morse Center, Port Sarashire, NM 03453', '088739944541');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Scott', 'Oneill', '1997-05-16', '39390 Mann Glen Suite 187, Jonathanmouth, AL 29680', '080363770384');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('John', 'Torres', '1992-11-17', '575 Cooper Tunnel Suite 858, Sextonton, CA 94823', '083772600022');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kristen', 'Armstrong', '2003-01-05', '72069 Kevin Tunnel Suite 472, Hayesland, OK 72677', '082994597425');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Elizabeth', 'Anderson', '1992-02-23', 'Unit 3452 Box 1952, DPO AA 39976', '080404757666');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Matthew', 'Coleman', '1991-10-25', '5744 Anna Vista Suite 127, Mitchellberg, TN 63166', '081781950151');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Tyler', 'Henderson', '1997-04-06', '57392 Phillips Mills Apt. 971, Port Ashley, PW 84527', '081728359329');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Mike', 'Mejia', '1998-01-21', '49421 Welch Tunnel Suite 341, South Victoria, PW 00667', '085348127724');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Eric', 'Nelson', '1991-10-13', '6494 Alex Causeway, New Erica, NJ 14696', '089682107948');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michelle', 'Hampton', '1997-04-16', '717 Wolfe Squares Suite 374, East Stevenside, AR 19021', '083620497348');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Patrick', 'Wilson', '1993-07-15', '0557 Donna Bridge Apt. 746, Josephstad, WI 60111', '082253844492');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Brittany', 'Barnes', '2001-12-19', '98817 Jeremy Estate Suite 179, Kristenland, MP 04830', '080538816125');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Susan', 'Bauer', '1999-01-19', '74811 Mercado Mission Apt. 066, East Jason, MP 46692', '084731890543');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Dominic', 'Garcia', '1992-08-05', 'USNS Davis, FPO AP 84031', '087698777013');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sally', 'Reed', '1997-02-13', 'Unit 5606 Box 1468, DPO AP 69247', '082995755819');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Joshua', 'Macdonald', '2003-05-27', '92099 Ford Landing Suite 149, Carlaton, CO 35102', '088418444320');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Richard', 'Rogers', '2002-06-10', '1625 Carter Islands, Williamsside, KS 53234', '087062575677');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Ruben', 'Carr', '1991-08-10', '6538 Dickerson Burg, Port Rachelhaven, NV 25929', '080483044350');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('John', 'Clark', '1993-01-07', '77095 Stacey Loaf, New Joycefort, IA 16319', '087465114637');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sharon', 'Vega', '1993-10-24', '58617 Webb Hill, North Karaland, CO 05240', '082080595658');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Luis', 'Schultz', '2002-08-16', '17366 Howe Square Apt. 109, Coryport, AZ 21536', '083358370682');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jack', 'Lopez', '2003-05-19', '92711 Lopez Common, Rogerburgh, LA 10312', '082080525451');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Donna', 'Bell', '1991-05-27', '441 Jenkins Mission Apt. 501, Port Nicholeberg, IA 90929', '083559106670');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Anthony', 'Owen', '1989-10-29', '12547 Johnson Run, Kirstenborough, NV 92343', '083801837880');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Andrew', 'Marsh', '1998-11-29', '1483 Huang Plaza, Knightfurt, MA 57003', '085388249708');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Robin', 'Stevenson', '1991-03-29', '4258 Mitchell Field, Lake John, NH 54702', '080770124334');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Cathy', 'Short', '1996-06-04', '2657 Morgan Extensions, New Michaelland, KS 03051', '088153224455');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Marie', 'Olson', '1997-06-23', '40273 Michelle Garden Suite 185, Peterchester, MP 52118', '085470595647');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michael', 'Brown', '1999-09-08', '517 Jason Rue, East Andrea, NM 76020', '087799155264');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lauren', 'Kim', '1991-12-09', '988 Frederick Harbors Apt. 291, Kingport, PR 28834', '082639033573');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jacob', 'Pham', '1997-12-03', '6019 Kevin Way Suite 273, South Derek, PW 15645', '082348350772');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Katelyn', 'Davidson', '2000-09-09', '070 Reed Trace Suite 108, West Amberton, MT 55842', '087176508347');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michele', 'Morris', '1998-04-08', '215 Baker Lights, Lake Sandraborough, VT 18479', '089454521538');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Daniel', 'Hoffman', '1994-01-14', '36767 Gonzalez Lane Suite 822, South Jameschester, CO 52275', '080511613550');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Bianca', 'Grant', '2001-01-21', '751 Hill Pines Apt. 534, North Isaacchester, AK 78516', '081885310686');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Randall', 'Green', '1994-11-11', '36557 Dunn Landing Suite 545, North Kevin, OR 16067', '086162813227');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('April', 'Miller', '2001-05-30', '632 Lisa Via, Gardnerland, VI 63374', '088243236247');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Dawn', 'Hughes', '2003-01-25', '8122 Ellis Mall Apt. 192, Lake Coreystad, MI 46944', '088672376298');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Laura', 'Guzman', '1999-03-05', '1623 Darrell Curve, Youngton, RI 66762', '088953864650');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('John', 'Nichols', '1998-05-23', 'Unit 8193 Box 9941, DPO AA 46626', '083622559791');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Matthew', 'Kent', '2001-03-12', '469 Justin Garden Apt. 101, Debraton, NY 80184', '082192648592');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kristopher', 'Brock', '2003-06-04', 'PSC 9151, Box 9522, APO AA 90711', '088789373421');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Danielle', 'Patton', '1998-03-11', '46131 Anthony Port, South Kelly, IL 59009', '082772716582');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jacob', 'Le', '2004-05-16', '0704 Anthony Greens Suite 810, New Michelle, ID 23430', '089967563554');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Mariah', 'Martinez', '1999-03-29', '2854 Elizabeth Port Suite 709, Port Christopherchester, KY 73300', '080169364016');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Stacy', 'Knight', '2001-04-18', '93082 Romero Dam Suite 125, North Mackenziemouth, NH 46789', '086212395202');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('William', 'Morrison', '2004-03-13', '054 Williams Drives Suite 508, Collinsberg, LA 85543', '089247201028');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sara', 'Bailey', '1991-12-26', '4842 Brock Mission Suite 502, New Stephanie, MI 11000', '084732240635');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Scott', 'Blair', '1999-11-18', '4598 Joseph Forges Suite 339, Cynthiaside, WV 58571', '083465314312');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Brian', 'Simpson', '1990-09-07', '529 Mclean Camp Apt. 062, Josephfort, NV 56340', '089925028235');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('James', 'Mendoza', '1999-02-12', '9708 Mark Island Apt. 866, North Timothy, IA 65209', '089193991358');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Christina', 'Morris', '2001-06-29', '189 Larson Motorway, North Johntown, NE 47383', '084178086453');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Peter', 'Hatfield', '2001-09-23', '823 Kathleen Loaf, West Juliabury, CT 97048', '081205458116');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Amanda', 'Gaines', '1993-07-29', '4258 Brown Village, North Kaylaview, WY 01926', '083865762107');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Angela', 'Zamora', '1996-10-26', '6765 Pearson Lane Apt. 973, Robertborough, TX 88803', '088880502576');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sheila', 'Roberts', '2003-04-12', '03474 Campbell Stravenue, West Daniel, OR 37653', '085629124445');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('James', 'Weber', '2000-10-24', '9475 Gonzalez Throughway Suite 240, New Lauren, SD 81370', '083006444124');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Marisa', 'Cook', '1991-11-08', '871 Daniel Causeway, Leeborough, MS 07915', '082981045768');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Trevor', 'Summers', '2000-03-12', '6806 Cobb Drives, Kellyside, MP 06008', '085007183592');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lawrence', 'Knapp', '1998-04-07', '386 Theresa Island Suite 519, South Alicia, OK 97175', '085760932149');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Stephanie', 'Brooks', '1996-12-31', '23707 Tamara Station, Port Williamton, CT 90622', '084326924019');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Julia', 'Robbins', '1991-08-04', '34454 James Port Suite 884, Shawtown, AK 35240', '085528298855');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Matthew', 'Daniels', '1992-03-18', '68706 Fox Trafficway Apt. 206, Munozville, IN 87502', '080369114121');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Anthony', 'Nolan', '1993-11-10', '98063 Giles Loop, Calvinborough, MT 31723', '088888627508');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Abigail', 'Boyle', '1998-08-23', '741 Benjamin Vista Apt. 377, Johnshire, ME 75355', '084238777181');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Amy', 'Young', '1998-12-03', '219 Angela Prairie Apt. 580, East Christophermouth, HI 39077', '089194670023');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Nicole', 'Calderon', '1992-08-23', '839 Jacqueline Grove Apt. 090, Hernandezburgh, AR 11053', '080544632315');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Ruben', 'Smith', '1998-04-30', '25250 Michael Locks, Janicehaven, ME 24279', '080459916654');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sandra', 'Williamson', '2000-10-10', '83557 Kenneth Mall Suite 486, Carolineshire, PR 84500', '082522620881');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jason', 'Powell', '2000-07-29', '11378 Ortiz Ville Suite 352, Kimberlyborough, FM 00939', '080964863371');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Amanda', 'Porter', '1994-06-19', '77066 Barrera Throughway, Johnshire, NH 97378', '086855105785');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('James', 'Wilson', '1992-05-16', '20778 Jordan Creek Suite 017, North Alextown, SD 83043', '084782157270');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kevin', 'Michael', '1990-01-13', '315 Paula Walk Suite 853, Lake Amandachester, NY 85640', '089820100745');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Nathan', 'Phillips', '1994-05-21', '16770 Bradley Mountains Suite 672, Glennborough, MP 85307', '087591934811');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jose', 'French', '2001-03-10', '9425 Sean Drive, Matthewborough, FM 55286', '087500300986');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rachael', 'Fowler', '1994-05-27', '793 Whitney Plains Suite 246, Tracychester, WA 98833', '086577773836');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('David', 'Peterson', '1997-06-15', '495 Michael Shoals Apt. 939, West Jesushaven, HI 65690', '081816953567');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Margaret', 'Cook', '1992-12-12', '02565 Stevens Keys Suite 439, Millerville, NC 62181', '083619261328');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Andrew', 'Johnson', '1997-04-05', '1662 Douglas Groves Apt. 057, East Heidi, DE 50975', '086198078058');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Patrick', 'Rivera', '1995-04-09', '134 Waters Locks, South Garymouth, AR 88174', '083060879940');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Amy', 'Galloway', '1999-04-11', '97746 Mendoza Trafficway Apt. 304, Port Caitlinville, OH 90465', '087345161400');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Ronald', 'Rodriguez', '2002-12-30', '70060 Anderson Harbors Apt. 583, Powersstad, NC 36445', '081816290557');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Yolanda', 'Rodriguez', '1992-03-14', '3076 Christina Bridge, New Jesseborough, IA 90284', '082403364928');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rachel', 'Cruz', '1992-08-02', 'USCGC Jones, FPO AA 45670', '088318942344');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Dawn', 'Joseph', '1994-06-09', 'PSC 1173, Box 0224, APO AA 76971', '085683883167');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Denise', 'Gomez', '1998-01-26', '9860 Nicholas Street Apt. 202, Foleyfort, NM 14591', '082816905097');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Paul', 'Williams', '1996-03-23', '538 Cody Fort, South Julie, MI 88950', '088131808243');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Melissa', 'Price', '1993-11-28', '893 Jason Extensions, Josephberg, AL 07639', '081187444559');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Larry', 'Lozano', '2004-02-19', '94438 Louis Tunnel Apt. 535, Port Jeremy, KY 31924', '089669388305');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Tamara', 'Pacheco', '1999-05-09', '017 Rivera Mission Apt. 602, Grayville, AK 97440', '089038229938');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lindsey', 'House', '1999-07-07', 'PSC 2602, Box 5100, APO AA 03943', '080461749107');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michele', 'Hunt', '1997-11-01', '365 Perry Squares, South Ericaside, AL 84823', '082550198763');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Valerie', 'Dudley', '1995-10-13', '48512 Henry Mountains, Robleschester, CO 73141', '080613345099');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michael', 'Johnson', '2001-12-14', '98371 Lopez Ford, Colinchester, MT 27012', '080175438420');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('April', 'Romero', '2003-10-04', '871 Jones Cliffs, Wilcoxmouth, GU 63483', '089538480115');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Christina', 'Smith', '1996-05-05', '4392 Martinez Lodge Apt. 797, East Chase, MO 25263', '082933003474');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Chad', 'Williams', '2003-07-24', '3196 Christopher Harbors Apt. 717, Wangview, MI 54588', '083032887543');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Manuel', 'Soto', '1998-01-28', 'USCGC Jennings, FPO AP 48375', '080678996299');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Courtney', 'Flynn', '1993-01-26', '394 Davis Overpass, North Erinville, LA 64587', '081340888636');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Leslie', 'Allen', '1998-09-12', '9795 Lowery Walks Suite 678, Charlesburgh, AR 42285', '088216573880');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Andrea', 'Nelson', '2004-01-26', '971 John Parks Suite 382, Griffithhaven, NC 74198', '089293374828');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kirsten', 'Wagner', '1999-06-12', '49687 Jeff Spur, North Dianaton, IA 40819', '082892867174');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Christina', 'Bailey', '1998-04-28', '9887 Gregory Expressway Suite 561, Melissamouth, PR 40977', '085338912105');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Timothy', 'Butler', '1991-09-26', '9335 Martinez Drive Apt. 868, Lake Sallyshire, WA 80646', '086090073692');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Miguel', 'King', '2003-02-17', '729 Tyler Extensions Apt. 803, North Luisstad, AR 38461', '082699091706');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Christopher', 'Kennedy', '2002-06-27', '49291 John Key Apt. 804, Hooperland, KS 51348', '084081752103');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lauren', 'Johnson', '1999-10-26', '6066 John Bypass, West Luisville, VA 16489', '082213135107');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Samantha', 'Ford', '1999-03-05', '7555 Smith Keys Apt. 193, North Lindsey, MI 02488', '084167215159');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Micheal', 'Escobar', '1993-07-16', '96400 Morton Plain, Danielmouth, VA 55547', '088620546539');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jerry', 'Walsh', '1989-12-16', '3300 Carter Corners, West John, MT 19193', '082601353759');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jeffery', 'Lee', '1990-05-29', '860 Michael Station Apt. 251, West Joshua, DC 53492', '084609405088');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Elizabeth', 'Wilkerson', '1993-12-20', '89159 Austin Lock, Michaelview, FL 07540', '089432742537');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jennifer', 'Miller', '2002-08-11', '9178 Mcpherson Fall Apt. 298, West Gabriel, AR 35728', '081202610837');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('William', 'Stephens', '1990-04-25', '3881 Cassidy Islands, West Valerie, MS 10650', '086665128931');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Katrina', 'Lawrence', '1992-04-25', '84052 Timothy Dale Suite 178, East Danielport, CA 09122', '088674666928');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Denise', 'Church', '2002-10-05', '1324 Lambert Expressway Apt. 654, New Robertview, NE 14555', '083515055391');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('James', 'Patterson', '1994-01-28', 'USS Brooks, FPO AP 78966', '088952906269');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Justin', 'Horton', '2001-06-15', '20419 Harrison Corners Apt. 493, South Sergiobury, AK 21553', '088045358358');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('David', 'Martin', '1998-04-22', '14856 Warren Cliff, Collinsberg, NH 40093', '082275634909');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Daniel', 'Mueller', '1999-06-04', '54823 Mackenzie Rapids, West Joel, UT 88098', '088586047584');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Timothy', 'Hughes', '1998-05-05', '4733 John Way, Smithside, CT 36531', '088366171146');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Danny', 'Potts', '1990-10-12', 'USCGC Roberts, FPO AA 40352', '080043997186');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Randy', 'Curtis', '1991-04-04', '41444 Joyce Summit, New Stephenport, FM 28034', '084707375442');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sarah', 'Pineda', '1999-11-27', '2605 Miller Field, South Scott, PW 28929', '087017169662');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jacqueline', 'Edwards', '2001-12-22', '3367 Harrison Well, West Julieport, MS 39000', '082950857862');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Victoria', 'Stevens', '1999-07-14', '00736 Lee Manor Suite 360, Morsemouth, NM 28360', '080101196936');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Gary', 'Lucas', '2000-02-24', '47919 Kelly Port Suite 802, Lucasmouth, RI 50184', '085364900412');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Bruce', 'Smith', '1991-10-04', '3383 Lance Curve Apt. 977, Lake Roger, AZ 45492', '081094443891');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Cynthia', 'Paul', '1990-09-23', '7942 Rogers Ferry Suite 040, South Stacy, GA 42426', '088093928356');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jeffrey', 'Harper', '2004-06-07', '807 Monica Islands Suite 188, West Lindamouth, WV 16811', '081418286185');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Erika', 'Ruiz', '1991-07-19', '3930 Shawn Fall Suite 046, Kaylamouth, NE 94341', '084397213844');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Eric', 'Parrish', '2000-06-26', '4584 Kim Circle Apt. 126, North Debraborough, NC 64024', '081855779787');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Joseph', 'Martin', '2003-08-28', '874 Davis Road, Jacobborough, ME 81187', '089066144343');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jennifer', 'Rodriguez', '1993-04-21', '190 Allison Forges Apt. 077, Henryberg, IN 14642', '082240027951');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Ashley', 'Archer', '1999-03-12', '513 Ashley Fords, West Garychester, DC 50274', '085674435394');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Paul', 'Rivera', '2002-02-02', '0741 Wilson Station Suite 408, Mayburgh, VI 59429', '084300631329');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sandra', 'Cook', '2002-06-18', '9729 Fisher Islands, Kenttown, NM 12202', '081232506167');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jackie', 'Shaw', '2000-11-30', '104 Medina Canyon, Port Debrabury, VI 98448', '083410684752');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Stephanie', 'Moon', '1990-01-13', '05451 Jesse Stream Suite 778, Foxton, IL 63590', '089076612755');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kimberly', 'Acosta', '1992-02-14', '0371 Boyle Parkways Suite 453, Bishopville, FM 36143', '083140049762');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jill', 'Butler', '1994-06-09', '5790 Eric Course, North Tiffany, VT 51742', '087089069250');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Shane', 'Wilson', '2002-08-22', '95531 Drake Shoal, Beckerbury, MI 99404', '084062788560');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jade', 'Foster', '1991-09-01', '4903 Theresa Throughway, Allenville, NJ 80091', '080290912714');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kevin', 'Dodson', '1997-09-12', '943 Lopez Vista, Nolanland, IA 99859', '080870943465');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jessica', 'Trujillo', '1989-11-03', '5492 Gallegos Pine Apt. 480, Yufort, ME 88006', '089681769428');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jeffrey', 'Farmer', '1994-12-26', 'USNS Morris, FPO AP 34409', '089940671614');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lee', 'Reed', '1997-03-28', '20687 Ruiz Canyon, Thompsonmouth, MD 44463', '085955868040');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Wanda', 'Lawson', '1991-02-22', '256 Brown Villages Apt. 655, Robertsland, PW 35199', '084372987844');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Amy', 'Jennings', '1990-12-09', '30758 Fischer View, North Mark, OH 58194', '083993953190');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Laura', 'Ramirez', '2003-05-16', '850 Andres Avenue Apt. 142, Bentleyfurt, MO 07781', '089606383747');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kimberly', 'Mclaughlin', '2002-07-02', '3090 Brock Shoal, Rodneyport, VI 01011', '081320643753');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Taylor', 'Taylor', '1996-05-29', '19858 Houston Pines Apt. 737, Port Meganchester, VA 06725', '084485817644');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Teresa', 'Hill', '1992-08-04', '3057 Parker Passage Suite 372, North Josemouth, GU 98729', '085102284029');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Joseph', 'Davis', '2000-05-28', '82646 Christine Shoal Apt. 506, North Toni, DC 05415', '081872559467');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Stephen', 'Weber', '1995-12-07', '0218 Lutz Cliffs, Lisatown, PR 26728', '088876892085');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Anthony', 'Scott', '2000-10-17', 'Unit 1453 Box 9185, DPO AP 99743', '081765425641');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('David', 'Wilson', '2001-12-24', '926 Michael Mission, Jackhaven, MT 09684', '088254374911');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jared', 'Turner', '1993-08-11', '30863 Miller Cape Suite 971, Williamsberg, NH 24997', '087318784710');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rachael', 'Hill', '1994-02-14', 'Unit 2786 Box 7342, DPO AE 23674', '088510521116');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Dan', 'Garcia', '1993-04-22', '1102 Clark Rue Suite 382, Tristanberg, OH 45289', '080844176443');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sergio', 'Tanner', '2000-05-20', '59398 Stephanie Way, South Kristine, MN 60161', '083306450982');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Richard', 'Pitts', '1997-03-18', '14180 Martin Harbor, East Sarahfurt, IA 40262', '087671212274');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('James', 'Rivera', '1997-07-19', '30662 James Port Apt. 683, Crystalstad, VA 06538', '084778347783');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Brandon', 'Summers', '1991-02-05', '41889 Anthony Roads Suite 017, Lopezmouth, OR 16150', '080323020103');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michael', 'Brock', '2000-02-27', '6800 Jones Forge Apt. 069, Smithland, DE 57985', '081936727669');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Paul', 'Allen', '2002-05-28', '977 Rice Parkway Suite 235, North Kevin, RI 09354', '080144845211');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Carla', 'Clark', '2000-08-24', '99378 Smith Road, Lake Kennethville, SC 64636', '083840170049');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Natasha', 'Vincent', '2003-07-30', 'PSC 6833, Box 3344, APO AA 17601', '086863905129');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Angela', 'Torres', '1997-01-21', '6108 Elizabeth Villages Suite 667, Josephville, MN 06668', '080762093322');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Steven', 'Benson', '1992-08-17', '73219 Carrie Port, Simsberg, NM 62846', '088585446224');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Wendy', 'Carson', '1991-12-19', '634 Nguyen Island, Rogersfurt, MI 24468', '088046985861');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('James', 'Booth', '1996-10-07', 'Unit 0042 Box 4588, DPO AA 03955', '089098661636');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jessica', 'Graham', '1994-03-12', '19376 Jones Garden, New Brandybury, ND 35259', '086707321992');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Hannah', 'Garcia', '2001-05-11', '547 Williams Fields, New Jennifertown, KY 40985', '088059044230');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michael', 'Miller', '2002-07-01', '20280 Johnson Springs, Port Christopher, NV 55089', '086567648492');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Ryan', 'Macdonald', '2002-06-29', '0793 Mann Turnpike Suite 820, Port Kenneth, CO 22084', '084579387623');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lisa', 'Anderson', '1996-01-16', '234 Sarah Center, East Benjaminfurt, OR 98421', '085376040803');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Samuel', 'Peterson', '1993-03-12', '7936 Christopher Burgs Apt. 711, New Alan, ID 35361', '087948896468');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lisa', 'Turner', '1992-11-20', '75657 Raymond Walks Suite 740, New Gregland, SD 71931', '088026076838');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Benjamin', 'Michael', '1994-12-20', '025 Tanya Lakes Suite 176, Benjamintown, IA 47826', '086440312802');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Julie', 'Coleman', '1996-10-14', '03023 Jason Greens, Shelbyshire, NJ 34689', '085100180640');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jason', 'Allen', '2004-04-24', '3205 Laura Throughway Apt. 901, East Robertview, CO 24707', '081750581897');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Julia', 'Carrillo', '2000-03-04', '33450 Campbell Route Apt. 096, South Jorgeshire, HI 42416', '080279571239');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Selena', 'Stewart', '1999-07-25', 'PSC 2522, Box 1720, APO AP 92730', '081202615002');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Joseph', 'Hart', '1989-07-23', '20703 Joseph Overpass Apt. 939, Martinview, MN 35203', '081424252742');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Steven', 'Campbell', '1999-09-24', '443 Amy View, Wrightport, MA 28883', '084715626451');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Tammy', 'Stanley', '1995-01-17', '38630 Elizabeth Forks, Allenmouth, NV 44770', '089116551715');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Alyssa', 'Hill', '1989-07-09', '24200 Amy Lights, Floresborough, KY 30473', '088338173996');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('David', 'Murphy', '2002-07-06', '62529 Cummings Stream, Courtneyfurt, NE 52103', '080897226499');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jason', 'Bradshaw', '1993-09-08', '778 Morse Keys Suite 631, Elijahberg, AR 28474', '086707786356');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sabrina', 'Edwards', '1991-02-27', 'USS Perez, FPO AA 55253', '087041686439');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Meghan', 'Houston', '1998-08-20', '23464 Ashlee Drive Apt. 042, East Jeffrey, TX 68220', '088531547761');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Hannah', 'Byrd', '1991-09-10', '8198 Ward Rapids, South Jennifer, CO 03914', '081803504748');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Monica', 'Webb', '1989-12-18', '6691 Amber Valleys, Cathybury, CT 76640', '084192056478');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Megan', 'Massey', '1991-01-24', '35063 Bradford Burgs Apt. 329, Miguelland, AL 71651', '085058389977');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Tonya', 'Smith', '1991-01-30', '4531 Priscilla Inlet Suite 886, West Jacobview, NE 26318', '089040277947');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Ronald', 'Walker', '2004-01-22', '1576 Jessica Mountains Suite 685, Alexanderstad, SD 98128', '084338277939');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Aaron', 'Fox', '1993-01-23', '3908 Riley Flat Apt. 625, East Briannaburgh, NE 35396', '083043645343');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Edward', 'Cole', '1990-02-05', '768 Jack Glen Apt. 504, East Jamesville, WY 95937', '081993878283');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kristine', 'Hayes', '1989-12-23', '91941 Samantha Valley, Collinsport, IN 09686', '083320054001');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Danny', 'Duarte', '1992-06-20', 'USS Wright, FPO AP 40718', '082270499548');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jonathan', 'Nolan', '2000-10-13', '400 Brown Throughway, South Nancy, OK 12907', '088531636112');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('John', 'Davis', '1996-08-29', '6139 Johnson Lock, East Heatherborough, OR 54583', '085102473701');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Vanessa', 'Hernandez', '2000-12-22', '22670 Johnston Track, New Kenneth, CA 60616', '089338737467');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Marissa', 'Stone', '1995-02-26', '0009 Kennedy Hills, South Franciscoberg, OR 62345', '089778522551');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kendra', 'Nelson', '1996-11-09', 'PSC 9388, Box 4016, APO AP 71920', '081855906423');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Vincent', 'Sanchez', '1990-04-07', '86348 Richardson Ferry Apt. 202, North John, FL 59589', '081606556995');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Erika', 'Thompson', '2003-11-01', '977 David Extension, Lorraineborough, MA 59965', '085910346476');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Darlene', 'Scott', '1994-07-15', '030 Joyce Estates, Howellchester, OR 09225', '086953460812');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michelle', 'Lucas', '2003-11-17', '6876 Brett Ridges, Stevenland, AR 80114', '081163510422');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jason', 'Mccoy', '1997-10-11', '9001 Valerie Corner, Trevorchester, TN 77471', '087506898977');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Paul', 'Johnson', '1995-03-26', '21492 Jones Key Apt. 573, Amandaton, IA 10062', '088767562775');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Reginald', 'Cain', '1997-04-17', '103 Felicia Rest Apt. 902, New Christina, AL 36542', '080181899695');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lindsey', 'Wallace', '1997-01-15', '4712 Glenn Gardens Suite 612, Carpenterhaven, FM 13647', '080419431892');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jennifer', 'Clark', '1994-07-23', '41100 Gwendolyn Manors, East Charles, PA 74302', '081325785448');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kyle', 'Roberson', '1992-10-14', '872 Diaz Station Suite 153, Tapiaberg, AL 87315', '085431059361');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Scott', 'Thornton', '2002-05-26', '0794 Danny Well, Karenport, WY 25062', '084278879481');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Mark', 'Andrews', '1994-02-28', '6740 Jason Wells, Noblemouth, AR 91305', '087869188183');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Joel', 'Mack', '1997-07-25', '890 White Terrace Suite 196, Mitchellstad, IA 32851', '084521685263');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Andre', 'Green', '1989-07-02', '31597 Fields Spur, Stephaniebury, WI 86498', '086369221531');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Ashlee', 'Moran', '2002-10-16', '738 Holloway Crescent, East James, WY 79895', '089374079886');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jessica', 'Garcia', '2001-12-18', '649 Patel Lake Apt. 825, Pughside, HI 39244', '088039964199');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Julie', 'Little', '2003-06-17', '8557 Richardson Trace, North Amandaville, MD 72179', '083779472437');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Amanda', 'Smith', '2001-02-12', '4615 Veronica Grove, Susanview, TN 07222', '085473776921');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Alexis', 'Lee', '1992-05-26', '01886 Joshua Shoals, Jasonfort, OR 37467', '086918994441');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rachel', 'Mann', '1996-10-12', '9261 Riddle Lane, South Felicia, OR 66033', '087581120399');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Gregory', 'Rasmussen', '1998-03-14', '093 Zhang Squares, Kingfort, KY 65714', '084686397519');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Nicolas', 'Jones', '1998-10-27', '126 Nathan Overpass, Catherineport, MS 25667', '087653258546');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jill', 'Mason', '2002-10-06', 'USCGC Carroll, FPO AP 88081', '081417453310');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michael', 'Willis', '1991-01-24', '259 Brown Crossing Apt. 262, Davidmouth, PA 41639', '080748850343');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('April', 'Martinez', '1991-09-08', '765 Jerry Tunnel, Amyport, AR 91405', '086328920983');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Alisha', 'Malone', '2004-02-22', '39650 Clark Drive, Katherineton, CA 70395', '085211310946');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jocelyn', 'Taylor', '2002-06-22', '35478 Wayne Plaza, Williamborough, HI 42122', '088512551914');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kayla', 'Carter', '1998-08-31', '1071 Andrew Point Suite 331, Troyview, DC 24404', '089186427279');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Roger', 'Lambert', '1989-08-30', '5008 Chang Plaza Apt. 969, Laurenton, IL 02144', '085629692125');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kristen', 'Roach', '1990-10-13', '13917 Copeland Brooks, South Nicholas, NY 65841', '088437253958');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Andrew', 'Sullivan', '2003-11-12', 'Unit 3696 Box 9499, DPO AP 28903', '087931695020');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Diana', 'Phillips', '2003-03-12', '464 Samantha Ports Apt. 196, East Nicole, CA 11378', '085670089129');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Ashley', 'Cohen', '2001-05-17', '0476 Mendoza Lights Apt. 913, Padillachester, NC 67038', '081582638511');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Cindy', 'Clarke', '1992-04-15', '57245 Jenkins Road, Williamfort, VA 77953', '087469053849');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Steven', 'Montgomery', '2000-08-17', '0080 Matthew Freeway, New Lauren, IA 29070', '087046281045');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Raymond', 'Jackson', '1994-07-25', 'PSC 1425, Box 2958, APO AA 71078', '081874774595');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Mary', 'Green', '2004-01-19', '7318 Frank Estates, Danachester, ND 58894', '087103687236');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Yolanda', 'Smith', '1994-03-16', '74588 Valdez Throughway Apt. 631, Pamelaland, DC 29001', '084223949016');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Tammy', 'Davis', '2001-08-12', '113 Dean Spring, Donaldshire, TN 11173', '087223767798');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('James', 'Coffey', '1999-04-24', '89701 Gonzalez Estate, Arielton, DC 91498', '084609158935');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Eric', 'Smith', '1995-02-11', '00761 Colin Shores, Theresahaven, KS 72982', '083369911024');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Susan', 'Santiago', '1999-06-02', '6659 Todd Neck Suite 022, Sandraport, AZ 76229', '085451086186');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Annette', 'Smith', '1993-01-10', '16815 Weaver Roads, Stephaniehaven, TN 51888', '080879815992');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Matthew', 'Smith', '2003-01-26', 'USCGC Stevens, FPO AE 18534', '081201208180');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lisa', 'Smith', '1996-05-23', '8550 James Stream, Scottchester, LA 57139', '083074224868');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Charles', 'House', '1991-10-28', 'Unit 9631 Box 5828, DPO AP 11336', '083499997900');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Luis', 'Decker', '1990-03-09', '656 Michael Union, Jasmineview, MO 99268', '086037443662');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('William', 'Cordova', '2000-03-08', 'Unit 3257 Box 1579, DPO AA 42197', '088506317336');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('David', 'Wright', '1996-05-17', '9681 Paul Ford, Hannahton, CO 49500', '087186281427');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Reginald', 'Smith', '1996-10-09', '513 Jeffrey Mount, New Alexisstad, MP 49832', '089349255145');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Brian', 'Roberts', '2002-02-17', '9837 Jeffrey Stream Suite 000, Port Christine, MA 49869', '082269072332');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Shannon', 'Grant', '1992-03-19', '85537 John Union, Jenniferview, IL 27390', '089928790131');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Brenda', 'Warren', '1990-03-10', '4223 Wang Key Suite 546, Leahfurt, AS 43146', '082353582965');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Joann', 'Green', '1989-12-21', '67880 Villanueva Burgs Suite 254, Port Crystalmouth, NV 28461', '089172641415');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jeanette', 'Graham', '2004-06-13', '64184 Jones Ford, Erikatown, SC 52273', '089506214744');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Brandon', 'Russell', '1998-06-08', '21440 Richards Radial Apt. 420, Port Brandon, NV 20926', '083310916664');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Ryan', 'Hamilton', '1990-09-20', '651 Alexander Mill Suite 698, Lynchbury, VA 10656', '087095535211');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Amanda', 'Martin', '1999-01-10', '4140 Jennifer Locks, Joyceside, ID 97358', '080327865476');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kimberly', 'Villarreal', '1994-05-22', 'USS Clark, FPO AE 41992', '084558591305');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Cynthia', 'Smith', '2003-09-11', 'Unit 5636 Box 3772, DPO AP 90025', '089302914332');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Robert', 'Reynolds', '1997-03-05', '59063 Kenneth Village Suite 893, Ayersport, TX 85617', '086160623193');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Anita', 'Ward', '1998-07-03', '93540 Stacey Ferry, Rogersshire, UT 68370', '080722094145');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Angela', 'Norris', '1998-06-07', '0465 John Rapids Apt. 509, Swansontown, MS 23781', '085632680342');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Samantha', 'Mullins', '1992-03-19', 'PSC 7195, Box 5423, APO AA 98456', '086011256706');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Marie', 'Clark', '1990-09-14', '87021 Arthur Plains, Millston, SC 93383', '087398352683');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Olivia', 'Blair', '1999-05-05', '61184 Miller Drive, West Kristen, IL 64595', '083924644184');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Bridget', 'Moses', '2002-12-17', '9142 Kevin Pass, Port Taraside, MS 97859', '088744280208');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Holly', 'Ball', '2000-08-08', '639 Mckinney Fall Suite 654, Lake Katherineland, DE 58889', '089959901491');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Larry', 'Clay', '1992-11-29', '14088 Hendricks Springs, Branchstad, GU 52652', '082210257286');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Amber', 'Fischer', '1999-03-07', '851 Black Field, Martineztown, OK 29518', '083968638182');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('John', 'Smith', '1999-05-25', '4243 Erika Points, North Lisatown, WY 75849', '088882664101');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jacob', 'Cordova', '1989-11-12', '204 Francisco Shores, Port Sarah, CO 81807', '086178973159');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sergio', 'Smith', '1991-09-20', '9490 Dana Falls Suite 114, Brettland, TX 70593', '082868449237');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Joshua', 'Baird', '1993-09-25', '5919 Matthews Streets Suite 390, New Mark, WV 47632', '083611492441');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kenneth', 'Williams', '1999-08-17', '0438 Thompson Key Suite 368, South Rachelhaven, OK 27727', '083238589069');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('William', 'Terry', '1999-01-03', '66209 Pamela Loaf, Lake Barbara, GA 84219', '088941197108');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Adrian', 'Johnson', '1996-02-07', '6691 Benjamin Islands Suite 767, Port Amanda, ME 82506', '080827547356');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Anthony', 'Gordon', '1994-03-02', '51112 Owen Course Apt. 513, Jonesborough, NC 49694', '087785776398');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Diana', 'French', '1994-12-19', '089 Stacy Fork Suite 272, Oliverborough, KS 80849', '085401372898');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Robert', 'Powell', '1994-04-02', '8250 Andrea Stream, New Amberfort, OR 49691', '082947949469');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Keith', 'Green', '1990-12-22', 'PSC 6759, Box 9704, APO AP 06990', '087334947542');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Isabel', 'Thomas', '1989-11-07', '4684 Robert Islands, Dawnland, OR 92099', '083296048694');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Larry', 'Compton', '1991-06-01', '5751 Williams Point, Christopherburgh, OK 01425', '086802589438');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lisa', 'Arias', '2004-01-31', '98696 John Cape Apt. 685, Lauraport, NH 40688', '089122047326');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lori', 'Miller', '1997-05-17', '403 Morris Forge, West Isabellaborough, ND 22153', '085168365330');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sarah', 'Rogers', '1996-08-07', '8555 Debra Way, East Cynthia, VI 06176', '085694144108');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Brianna', 'Medina', '1996-04-14', '197 Cobb Pass, Zimmermanland, GA 82319', '082959813498');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jamie', 'Romero', '1995-05-27', '10745 Pacheco Avenue, East Nancy, MH 12368', '083828678910');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sara', 'Compton', '2001-11-02', 'PSC 9236, Box 6094, APO AP 39923', '087335919652');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('John', 'Mayo', '1992-11-27', '1941 Natalie Manor Suite 790, Scottborough, MI 86472', '083552227594');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Stacy', 'Mitchell', '1993-08-28', '1928 Lisa Spring, New Stephanieberg, DC 20408', '088469707718');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Debra', 'Davidson', '2001-02-03', '1014 Jessica Roads, Grayton, MH 02771', '087335242946');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Mary', 'Briggs', '1991-12-14', 'PSC 0194, Box 0461, APO AE 01465', '082321543265');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Ashley', 'Johnson', '2002-10-13', '0273 Lambert Mews Apt. 652, Lake Monique, NY 92208', '082100459423');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Eric', 'Rodriguez', '2001-05-14', '492 David Square Apt. 730, Mitchellport, PA 93113', '086869351304');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jesse', 'Mcpherson', '1996-03-06', '51910 White Divide, North Amyton, VI 34568', '080743945199');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Barbara', 'Sharp', '1998-04-12', '574 Tran Plaza, Waltonmouth, TX 60641', '084084043443');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Matthew', 'Ryan', '1998-11-18', '71691 Ann Pike, North David, MP 97485', '088742901256');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jeffery', 'Lucas', '2000-10-05', '994 Rhodes Roads Suite 410, Mandyland, CO 22324', '086917745467');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Nicole', 'Chung', '1994-04-26', '90677 Nathan Shoal Suite 854, Port Benjamin, NC 73913', '088629992215');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kyle', 'Rodriguez', '1999-04-17', '8366 Kristen Springs Apt. 253, Turnerfort, WA 65843', '086670254472');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Alexander', 'Sims', '1997-02-16', '895 Brown Lodge, West Marcview, VI 81815', '088323738513');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rachel', 'Gonzalez', '2001-04-30', '0313 Alisha Keys, Angelamouth, SC 11669', '081292663694');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rebecca', 'Alvarez', '1999-06-22', '80156 Moore Cliffs Apt. 139, Elizabethburgh, GU 72693', '084696478968');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Mark', 'Elliott', '2003-01-25', '688 Ashley Cove Suite 572, North Kimberlyhaven, PW 80646', '084110670581');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Steven', 'Gray', '1994-03-16', 'USS Armstrong, FPO AA 46038', '085011483588');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Justin', 'Roberts', '1996-02-03', '19993 Frazier Views Apt. 999, West Kayleeborough, WV 71690', '080880820794');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Teresa', 'Reyes', '1991-08-20', '191 Cindy Common Suite 538, Michelebury, AK 03206', '087419780412');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lori', 'Harris', '1993-06-19', '30361 Alan Mission Suite 444, Lake Charlesberg, MA 38333', '083153538861');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rebecca', 'Mitchell', '1998-12-08', '436 Linda Mills, New Charles, UT 45302', '080620488697');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Katie', 'Snyder', '1990-01-24', '938 Mitchell Estates Suite 425, Garrisonport, OH 22741', '085932100665');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Charles', 'Moon', '1991-07-06', 'PSC 3525, Box 3535, APO AE 24796', '089052656267');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kristina', 'Reynolds', '2004-02-09', '60233 Emily Land, Elizabethbury, TN 69454', '088405181768');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jessica', 'Hernandez', '1991-03-11', '9621 Berg Oval Apt. 375, Martinezside, LA 97236', '084883511431');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Alejandra', 'Hart', '1994-07-29', '49013 Wilson Light Suite 141, New Carlafurt, DE 86429', '087867863096');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rebecca', 'Schmidt', '1993-12-03', '2196 Randall Stravenue, Ninamouth, AK 98803', '082334235119');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Darrell', 'Perez', '2004-01-15', '51193 Dan Centers Suite 059, South Lance, OK 70700', '080623947468');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('William', 'Anderson', '1992-04-30', '0474 Boyer Roads, Margaretland, MN 11386', '084523367071');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Amy', 'Douglas', '2000-05-16', '4390 Ray Harbors Suite 432, Port Melanieside, TN 66124', '082787305852');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Nicole', 'Potts', '2002-02-10', '6041 Dixon Hill, North Jenniferland, WA 89967', '086359272702');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sydney', 'Jordan', '1997-07-27', '6678 Santiago Extensions Suite 792, Kimberlyburgh, WA 54887', '084121620071');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michelle', 'Allen', '2000-07-11', '4350 Anita Turnpike, East Frank, OR 22784', '087588279183');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Beverly', 'Eaton', '1989-07-27', '94678 Ward Hills, East Kathryn, CT 70475', '083492143587');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Eric', 'Cantrell', '1995-12-31', '6912 Deanna Bridge Apt. 954, South Katie, DE 20764', '086108944565');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Zachary', 'Ford', '2001-07-27', '962 Gonzalez Mountains Apt. 137, New Jessicastad, LA 69914', '082460039517');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Marcus', 'Gilbert', '1994-11-07', '3746 Adams Valley, New Brittanyshire, AK 68710', '080794624350');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Dennis', 'Anderson', '1999-04-28', '65286 Johnson Plain, Allisonport, GU 50585', '087385162606');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('William', 'Macias', '1998-07-03', '8199 Shirley Common, South Cindybury, AL 05616', '085328357760');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kyle', 'Massey', '1992-05-02', '507 Compton Common Apt. 595, Robinsonburgh, SD 77690', '088235816866');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Rebecca', 'Brewer', '2000-08-22', '63632 Sarah Island, New Scott, MA 03818', '089822663224');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Christine', 'Phillips', '1995-07-28', '4493 Davis Manor, Port Bethhaven, NV 81359', '083708751036');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michele', 'Dunlap', '1996-07-04', '97878 Ortiz Stravenue, South Tracy, AL 17300', '087126428838');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Angela', 'Lane', '1992-12-12', '0182 Terry Neck Apt. 728, West Christopher, NY 28615', '080601548921');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sherry', 'Dennis', '1999-12-22', '526 Joseph Village, Port Anne, IA 31983', '087930176035');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Gilbert', 'Rogers', '1990-10-05', '8018 Roman Neck, Amandastad, DE 51372', '080977665465');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Tina', 'Hughes', '1999-09-24', '51250 Jason Squares Apt. 684, Port James, RI 97958', '084877438104');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kevin', 'Taylor', '1994-08-02', '10325 Jenna Passage, Brettburgh, AR 00626', '083739064872');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Judy', 'Stevenson', '1996-09-27', '31244 Fernandez Spurs Suite 769, Daltonville, DC 30398', '089055657930');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Shannon', 'Baker', '2001-02-01', '397 Benjamin Spring Suite 572, Schmidtside, CA 17678', '080603926374');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Anna', 'Thomas', '2003-07-02', '26543 Joyce Lights Suite 474, Port James, LA 42744', '082345515717');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Carl', 'Perez', '1990-06-07', 'PSC 1798, Box 8236, APO AA 27355', '087137915086');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kimberly', 'Salazar', '1995-05-01', '5720 Richardson Villages, South William, KY 11097', '082649492545');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('David', 'Hughes', '2000-11-11', 'USS Barnes, FPO AE 09965', '087697833484');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jennifer', 'Carson', '1997-04-06', '561 Green Land, Jamesburgh, MO 12518', '081415545600');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Carmen', 'Anderson', '1997-02-11', 'USNV Lee, FPO AA 61864', '080371467945');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kristina', 'Ball', '1993-09-28', '196 Emily Villages, Cynthiahaven, ND 69879', '085170933489');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Juan', 'Collins', '1998-02-12', '278 Hampton Underpass Apt. 210, Blakeport, FL 72821', '083042182232');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('David', 'Rios', '2001-11-08', '625 Karen Vista, Port Sarahmouth, ND 39258', '082777909504');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Mark', 'Jenkins', '1999-10-08', '24092 Jacqueline Prairie, Lake Hannah, AR 72127', '081394819567');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jonathan', 'Terrell', '2003-11-14', '590 Christopher Fields, Port Elizabethberg, MN 96214', '083136317760');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Matthew', 'Miller', '1991-03-08', '3679 Bobby Fields Apt. 910, North Kathleenbury, PW 45123', '087351546987');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Donald', 'Hernandez', '1999-08-09', '6665 Adams Square, Port Robertstad, MS 70797', '084181110215');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michael', 'Thompson', '2002-10-18', '2976 Joshua Branch, Mcculloughburgh, MH 56334', '080969164839');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Raymond', 'Kemp', '1991-09-14', '00516 Matthew Burgs, Port Williamberg, GA 43774', '089133831394');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Devon', 'Thomas', '1990-06-01', 'USNV Nichols, FPO AA 38836', '080783398958');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Christina', 'Ayala', '1991-12-23', '12827 Alvarez Orchard Apt. 851, Elizabethchester, OK 16366', '088072186929');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Danielle', 'Howard', '1991-12-25', '8756 Newton Shore, Walkershire, OK 40587', '080609075469');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Jeffery', 'Johnson', '1990-11-03', '492 Miguel Ferry, Simsberg, GA 44681', '087575298706');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lisa', 'Leblanc', '1994-06-20', 'PSC 2985, Box 9636, APO AP 07872', '089716070643');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Sarah', 'Mason', '2000-05-22', '2262 Alicia Ford Apt. 924, North Williammouth, MI 25536', '085335632575');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Patrick', 'Payne', '1993-10-20', '009 Heather Glen, South Cathy, TX 87469', '088834174150');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Danny', 'Lawson', '1994-07-30', '515 Hardy Mountain Apt. 316, East Nathan, MD 97848', '088637875214');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('James', 'Villa', '1991-10-20', 'Unit 3410 Box 8867, DPO AP 78836', '083172962675');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Clarence', 'Mayo', '1995-08-30', 'USCGC Smith, FPO AP 71801', '087569550006');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Robert', 'Murray', '1991-02-25', '9270 Michelle Mountain Suite 178, Port Tracihaven, ME 88707', '088201253333');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Michael', 'Suarez', '2000-01-01', '8661 Kristen Gardens Suite 471, Lydiatown, RI 19294', '088119476468');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Steven', 'Clark', '1999-03-22', '72579 Denise Ways, Perryborough, IN 38453', '088845026818');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kelly', 'Harris', '2003-08-29', '62665 Baker Pike Suite 588, Catherineton, PA 19601', '080734000054');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Leah', 'Tate', '1996-12-01', '19160 Betty Trail Apt. 924, Bowenville, MH 57497', '087475938755');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Lisa', 'Thompson', '1997-09-08', 'PSC 3290, Box 5515, APO AP 05678', '089423848202');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kelly', 'Williams', '1990-05-23', '919 Riggs Burgs Suite 404, Ortizborough, PR 21873', '084618602331');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kenneth', 'Donovan', '2003-02-16', '314 Brittany Mountains, Williamschester, PR 40541', '082502783208');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Barbara', 'Briggs', '1993-03-15', '9424 Ralph Mission, Valeriebury, TX 89962', '084617840370');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Angelica', 'Short', '2001-12-07', '9419 Christina Road Suite 683, North Dennis, AS 42156', '087280686336');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Kayla', 'Dodson', '2004-02-24', '958 John Mountains Apt. 619, Jasmineport, MH 69054', '080775870525');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Carlos', 'Fitzpatrick', '1994-11-29', '1880 Jackson Lodge Apt. 035, Port Mikayla, SD 27563', '080855767825');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('John', 'Harmon', '1997-05-12', 'USCGC Carson, FPO AE 13500', '087173899443');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('David', 'Smith', '1996-02-19', '5235 Melissa Valley, West Jennahaven, WI 48278', '083382071095');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Anita', 'Pham', '1990-12-20', '8040 Vance Corners Apt. 779, Port Brian, AL 05632', '087238340140');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Pamela', 'Pham', '1991-05-20', '9255 Hughes Prairie, Stephensshire, FM 16314', '085411748724');
-INSERT INTO ApplicantProfile (first_name, last_name, date_of_birth, address, phone_number) VALUES ('Charles', 'Townsend', '2000-06-18', '1298 Frank Causeway Suite 911, North Christian, PA 72728', '085481431373');
-
--- INSERT INTO ApplicationDetail
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (1, 'HEALTHCARE', '11121498.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (2, 'INFORMATION-TECHNOLOGY', '12171093.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (3, 'INFORMATION-TECHNOLOGY', '12839152.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (4, 'ADVOCATE', '12155206.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (5, 'ADVOCATE', '11378657.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (6, 'TEACHER', '10480456.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (7, 'SALES', '15581242.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (8, 'ENGINEER', '12239749.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (9, 'ADVOCATE', '13807808.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (10, 'SALES', '12826414.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (11, 'BUSINESS-DEVELOPMENT', '12777487.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (12, 'INFORMATION-TECHNOLOGY', '11614114.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (13, 'SALES', '13557622.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (14, 'DESIGNER', '15011085.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (15, 'CONSULTANT', '18932512.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (16, 'HEALTHCARE', '12251115.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (17, 'HEALTHCARE', '16300459.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (18, 'ACCOUNTANT', '13477922.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (19, 'BUSINESS-DEVELOPMENT', '14554542.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (20, 'ADVOCATE', '18264694.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (21, 'BUSINESS-DEVELOPMENT', '16962067.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (22, 'DESIGNER', '12526702.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (23, 'ADVOCATE', '13575312.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (24, 'BUSINESS-DEVELOPMENT', '10265057.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (25, 'ENGINEER', '14724186.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (26, 'ACCOUNTANT', '14470533.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (27, 'FITNESS', '10624813.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (28, 'ADVOCATE', '12786012.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (29, 'BUSINESS-DEVELOPMENT', '16661264.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (30, 'ACCOUNTANT', '13583538.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (31, 'HR', '12420359.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (32, 'ADVOCATE', '10276858.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (33, 'ACCOUNTANT', '13014900.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (34, 'CONSULTANT', '12955994.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (35, 'FITNESS', '11152490.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (36, 'ACCOUNTANT', '13809698.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (37, 'ACCOUNTANT', '10466583.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (38, 'ADVOCATE', '13812481.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (39, 'FITNESS', '12377803.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (40, 'ACCOUNTANT', '10504237.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (41, 'ADVOCATE', '14556869.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (42, 'HEALTHCARE', '11333001.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (43, 'BUSINESS-DEVELOPMENT', '10820510.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (44, 'DESIGNER', '12413512.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (45, 'ENGINEER', '10641230.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (46, 'SALES', '11257723.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (47, 'ENGINEER', '11653906.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (48, 'CONSULTANT', '12544735.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (49, 'TEACHER', '13195436.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (50, 'INFORMATION-TECHNOLOGY', '12059610.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (51, 'DESIGNER', '10332998.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (52, 'TEACHER', '12860543.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (53, 'HR', '14663897.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (54, 'INFORMATION-TECHNOLOGY', '15100547.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (55, 'HEALTHCARE', '10567764.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (56, 'ENGINEER', '10889157.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (57, 'TEACHER', '12938389.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (58, 'ENGINEER', '12904972.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (59, 'CONSULTANT', '15041689.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (60, 'ENGINEER', '11773767.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (61, 'ADVOCATE', '22452756.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (62, 'HEALTHCARE', '14381464.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (63, 'DESIGNER', '69097572.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (64, 'BUSINESS-DEVELOPMENT', '10466208.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (65, 'FITNESS', '14126433.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (66, 'BUSINESS-DEVELOPMENT', '38707449.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (67, 'CONSULTANT', '13130984.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (68, 'BUSINESS-DEVELOPMENT', '11160414.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (69, 'DESIGNER', '11555549.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (70, 'FITNESS', '63158213.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (71, 'SALES', '12802330.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (72, 'HR', '13386301.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (73, 'ACCOUNTANT', '14886205.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (74, 'BUSINESS-DEVELOPMENT', '14146106.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (75, 'HEALTHCARE', '12212468.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (76, 'INFORMATION-TECHNOLOGY', '11804712.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (77, 'TEACHER', '11580408.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (78, 'ENGINEER', '13393401.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (79, 'ACCOUNTANT', '10251432.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (80, 'FITNESS', '16849128.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (81, 'HEALTHCARE', '11672279.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (82, 'BUSINESS-DEVELOPMENT', '14014749.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (83, 'SALES', '13774329.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (84, 'BUSINESS-DEVELOPMENT', '10515955.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (85, 'ENGINEER', '16887936.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (86, 'FITNESS', '14626780.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (87, 'DESIGNER', '15603319.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (88, 'FITNESS', '10738095.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (89, 'ADVOCATE', '12696104.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (90, 'HR', '12669075.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (91, 'BUSINESS-DEVELOPMENT', '12674256.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (92, 'DESIGNER', '14455622.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (93, 'HEALTHCARE', '15484097.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (94, 'CONSULTANT', '10182582.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (95, 'HEALTHCARE', '13313917.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (96, 'ENGINEER', '13215696.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (97, 'BUSINESS-DEVELOPMENT', '14958913.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (98, 'ENGINEER', '13328680.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (99, 'FITNESS', '11289482.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (100, 'FITNESS', '11797122.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (101, 'DESIGNER', '15553584.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (102, 'CONSULTANT', '15139979.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (103, 'ADVOCATE', '10219099.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (104, 'DESIGNER', '10527994.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (105, 'ACCOUNTANT', '10186968.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (106, 'FITNESS', '13569152.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (107, 'FITNESS', '11763983.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (108, 'TEACHER', '13343786.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (109, 'HEALTHCARE', '26829350.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (110, 'CONSULTANT', '12763627.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (111, 'ADVOCATE', '12504278.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (112, 'INFORMATION-TECHNOLOGY', '12144825.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (113, 'CONSULTANT', '12472574.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (114, 'TEACHER', '11850315.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (115, 'BUSINESS-DEVELOPMENT', '12467531.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (116, 'HEALTHCARE', '12938200.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (117, 'CONSULTANT', '13376919.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (118, 'ACCOUNTANT', '10985403.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (119, 'BUSINESS-DEVELOPMENT', '11262933.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (120, 'DESIGNER', '10734870.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (121, 'FITNESS', '13727873.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (122, 'BUSINESS-DEVELOPMENT', '10076271.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (123, 'INFORMATION-TECHNOLOGY', '15145575.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (124, 'CONSULTANT', '12351749.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (125, 'FITNESS', '16270906.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (126, 'SALES', '13586069.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (127, 'SALES', '12587973.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (128, 'ACCOUNTANT', '10333051.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (129, 'ADVOCATE', '17571262.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (130, 'FITNESS', '10030015.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (131, 'BUSINESS-DEVELOPMENT', '13087952.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (132, 'SALES', '13418452.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (133, 'ADVOCATE', '11605833.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (134, 'INFORMATION-TECHNOLOGY', '10724818.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (135, 'TEACHER', '13348915.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (136, 'HEALTHCARE', '10674770.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (137, 'FITNESS', '15265464.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (138, 'ACCOUNTANT', '15717923.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (139, 'TEACHER', '11890896.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (140, 'BUSINESS-DEVELOPMENT', '11752500.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (141, 'ACCOUNTANT', '12192507.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (142, 'CONSULTANT', '16407619.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (143, 'CONSULTANT', '10704573.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (144, 'DESIGNER', '14150896.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (145, 'INFORMATION-TECHNOLOGY', '12814706.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (146, 'INFORMATION-TECHNOLOGY', '13367322.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (147, 'DESIGNER', '16332293.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (148, 'ENGINEER', '14224370.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (149, 'HEALTHCARE', '14585273.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (150, 'HEALTHCARE', '11065180.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (151, 'CONSULTANT', '10984392.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (152, 'INFORMATION-TECHNOLOGY', '15224503.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (153, 'CONSULTANT', '12693146.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (154, 'ACCOUNTANT', '11005406.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (155, 'FITNESS', '10712803.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (156, 'ENGINEER', '14248724.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (157, 'HR', '12547982.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (158, 'ENGINEER', '11677077.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (159, 'INFORMATION-TECHNOLOGY', '14413148.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (160, 'FITNESS', '12717345.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (161, 'ACCOUNTANT', '15891494.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (162, 'HEALTHCARE', '12019284.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (163, 'FITNESS', '10554236.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (164, 'HR', '15226699.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (165, 'ADVOCATE', '14743911.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (166, 'HR', '10395944.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (167, 'HEALTHCARE', '14049846.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (168, 'SALES', '13907230.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (169, 'ENGINEER', '16492045.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (170, 'CONSULTANT', '12202337.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (171, 'TEACHER', '22732234.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (172, 'CONSULTANT', '10005171.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (173, 'HR', '12488356.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (174, 'BUSINESS-DEVELOPMENT', '10549585.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (175, 'ACCOUNTANT', '10553553.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (176, 'DESIGNER', '12082377.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (177, 'ACCOUNTANT', '14055988.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (178, 'BUSINESS-DEVELOPMENT', '13915715.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (179, 'HEALTHCARE', '11266906.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (180, 'ENGINEER', '12059198.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (181, 'DESIGNER', '12858898.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (182, 'ACCOUNTANT', '13675377.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (183, 'ENGINEER', '11624880.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (184, 'INFORMATION-TECHNOLOGY', '11835339.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (185, 'CONSULTANT', '12230301.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (186, 'ACCOUNTANT', '11704150.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (187, 'ADVOCATE', '12518008.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (188, 'HR', '10659182.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (189, 'HR', '10876132.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (190, 'ENGINEER', '11360471.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (191, 'DESIGNER', '24727739.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (192, 'FITNESS', '15118506.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (193, 'HR', '12022566.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (194, 'SALES', '13072019.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (195, 'DESIGNER', '13080868.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (196, 'ENGINEER', '10562768.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (197, 'CONSULTANT', '11130200.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (198, 'INFORMATION-TECHNOLOGY', '10089434.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (199, 'TEACHER', '13173522.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (200, 'HR', '13178604.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (201, 'CONSULTANT', '10926726.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (202, 'ACCOUNTANT', '12780508.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (203, 'INFORMATION-TECHNOLOGY', '14346702.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (204, 'HEALTHCARE', '14528265.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (205, 'INFORMATION-TECHNOLOGY', '13982572.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (206, 'BUSINESS-DEVELOPMENT', '12237267.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (207, 'ADVOCATE', '16449850.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (208, 'HEALTHCARE', '10501991.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (209, 'FITNESS', '11522068.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (210, 'INFORMATION-TECHNOLOGY', '13879043.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (211, 'ADVOCATE', '10333299.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (212, 'INFORMATION-TECHNOLOGY', '15499825.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (213, 'CONSULTANT', '11432686.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (214, 'BUSINESS-DEVELOPMENT', '10830646.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (215, 'BUSINESS-DEVELOPMENT', '17640785.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (216, 'ACCOUNTANT', '12920612.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (217, 'ENGINEER', '14408510.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (218, 'ENGINEER', '13858219.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (219, 'ADVOCATE', '14304010.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (220, 'INFORMATION-TECHNOLOGY', '10898339.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (221, 'SALES', '10149490.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (222, 'ADVOCATE', '41152404.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (223, 'HR', '15546686.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (224, 'FITNESS', '15484011.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (225, 'TEACHER', '11163645.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (226, 'ENGINEER', '14593060.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (227, 'TEACHER', '12674307.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (228, 'INFORMATION-TECHNOLOGY', '15856762.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (229, 'CONSULTANT', '13967854.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (230, 'FITNESS', '13909762.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (231, 'TEACHER', '14176254.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (232, 'ADVOCATE', '13199813.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (233, 'TEACHER', '12654876.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (234, 'CONSULTANT', '15083600.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (235, 'ENGINEER', '57706851.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (236, 'SALES', '12695537.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (237, 'ENGINEER', '16172429.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (238, 'BUSINESS-DEVELOPMENT', '11877150.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (239, 'INFORMATION-TECHNOLOGY', '10873344.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (240, 'DESIGNER', '11813872.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (241, 'CONSULTANT', '11677012.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (242, 'CONSULTANT', '12334650.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (243, 'BUSINESS-DEVELOPMENT', '10041713.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (244, 'FITNESS', '12748557.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (245, 'HEALTHCARE', '12338274.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (246, 'ACCOUNTANT', '12546838.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (247, 'FITNESS', '17312146.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (248, 'DESIGNER', '17392859.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (249, 'DESIGNER', '17510973.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (250, 'INFORMATION-TECHNOLOGY', '14508237.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (251, 'BUSINESS-DEVELOPMENT', '10541358.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (252, 'ACCOUNTANT', '12341902.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (253, 'HEALTHCARE', '11759079.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (254, 'TEACHER', '10603337.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (255, 'FITNESS', '15210069.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (256, 'ENGINEER', '10329506.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (257, 'BUSINESS-DEVELOPMENT', '12254068.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (258, 'BUSINESS-DEVELOPMENT', '14698557.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (259, 'DESIGNER', '11232471.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (260, 'ACCOUNTANT', '13701259.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (261, 'TEACHER', '11209758.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (262, 'TEACHER', '13234267.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (263, 'ADVOCATE', '10344379.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (264, 'SALES', '14256329.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (265, 'ACCOUNTANT', '17499196.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (266, 'BUSINESS-DEVELOPMENT', '14064815.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (267, 'ADVOCATE', '10588874.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (268, 'CONSULTANT', '13149176.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (269, 'HR', '23009962.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (270, 'HEALTHCARE', '11722421.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (271, 'HR', '23522150.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (272, 'FITNESS', '10289113.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (273, 'TEACHER', '16507693.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (274, 'HR', '14140903.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (275, 'HEALTHCARE', '13072354.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (276, 'DESIGNER', '18589927.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (277, 'ACCOUNTANT', '11676151.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (278, 'ADVOCATE', '11847784.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (279, 'ACCOUNTANT', '10399912.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (280, 'INFORMATION-TECHNOLOGY', '14569498.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (281, 'ADVOCATE', '13296856.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (282, 'ENGINEER', '11981094.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (283, 'SALES', '18448085.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (284, 'DESIGNER', '13454871.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (285, 'ACCOUNTANT', '11902276.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (286, 'ENGINEER', '14789139.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (287, 'BUSINESS-DEVELOPMENT', '12668625.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (288, 'HEALTHCARE', '10816645.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (289, 'TEACHER', '10281555.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (290, 'ACCOUNTANT', '12191094.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (291, 'SALES', '12315079.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (292, 'FITNESS', '10748989.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (293, 'FITNESS', '11995013.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (294, 'ENGINEER', '15765660.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (295, 'CONSULTANT', '11441764.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (296, 'TEACHER', '30709029.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (297, 'BUSINESS-DEVELOPMENT', '12011623.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (298, 'ACCOUNTANT', '11480899.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (299, 'BUSINESS-DEVELOPMENT', '13836471.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (300, 'DESIGNER', '11490673.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (301, 'CONSULTANT', '15620421.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (302, 'ADVOCATE', '15576950.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (303, 'INFORMATION-TECHNOLOGY', '23933031.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (304, 'CONSULTANT', '11957080.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (305, 'FITNESS', '13405733.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (306, 'HR', '13764840.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (307, 'ENGINEER', '14036515.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (308, 'BUSINESS-DEVELOPMENT', '10070224.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (309, 'ADVOCATE', '13503650.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (310, 'ENGINEER', '12545844.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (311, 'ENGINEER', '10969918.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (312, 'FITNESS', '10554045.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (313, 'DESIGNER', '13520837.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (314, 'DESIGNER', '15353911.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (315, 'ACCOUNTANT', '14209965.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (316, 'ENGINEER', '15306049.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (317, 'ACCOUNTANT', '13518263.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (318, 'ENGINEER', '12635195.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (319, 'HEALTHCARE', '11197262.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (320, 'ACCOUNTANT', '12065211.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (321, 'BUSINESS-DEVELOPMENT', '11698189.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (322, 'ACCOUNTANT', '10428916.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (323, 'ADVOCATE', '12045067.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (324, 'ENGINEER', '14009087.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (325, 'HEALTHCARE', '13574264.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (326, 'HR', '12333703.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (327, 'SALES', '22946204.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (328, 'ACCOUNTANT', '15053703.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (329, 'SALES', '16210888.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (330, 'HEALTHCARE', '31064969.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (331, 'BUSINESS-DEVELOPMENT', '14106638.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (332, 'TEACHER', '16653657.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (333, 'HR', '12613221.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (334, 'INFORMATION-TECHNOLOGY', '11137306.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (335, 'ADVOCATE', '14358578.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (336, 'ACCOUNTANT', '12085736.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (337, 'TEACHER', '11592605.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (338, 'ADVOCATE', '10464113.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (339, 'CONSULTANT', '13411858.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (340, 'TEACHER', '12890045.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (341, 'BUSINESS-DEVELOPMENT', '13888506.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (342, 'FITNESS', '14107571.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (343, 'BUSINESS-DEVELOPMENT', '11174187.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (344, 'FITNESS', '11635137.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (345, 'ENGINEER', '10235211.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (346, 'SALES', '13352113.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (347, 'ENGINEER', '11650031.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (348, 'TEACHER', '10176815.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (349, 'ADVOCATE', '11020140.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (350, 'HR', '14879257.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (351, 'ACCOUNTANT', '14640322.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (352, 'FITNESS', '11333660.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (353, 'HR', '15899269.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (354, 'ENGINEER', '11187796.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (355, 'TEACHER', '14722634.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (356, 'INFORMATION-TECHNOLOGY', '13565152.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (357, 'DESIGNER', '12695799.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (358, 'SALES', '11963737.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (359, 'CONSULTANT', '14062078.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (360, 'BUSINESS-DEVELOPMENT', '13837784.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (361, 'ADVOCATE', '13342150.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (362, 'DESIGNER', '19362586.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (363, 'BUSINESS-DEVELOPMENT', '10268614.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (364, 'BUSINESS-DEVELOPMENT', '12820557.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (365, 'HEALTHCARE', '12666174.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (366, 'INFORMATION-TECHNOLOGY', '10189110.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (367, 'SALES', '11887930.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (368, 'ACCOUNTANT', '13637605.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (369, 'HR', '11637468.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (370, 'BUSINESS-DEVELOPMENT', '27710853.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (371, 'ACCOUNTANT', '15790602.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (372, 'BUSINESS-DEVELOPMENT', '11616482.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (373, 'FITNESS', '12386670.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (374, 'FITNESS', '13385306.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (375, 'DESIGNER', '14391434.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (376, 'ADVOCATE', '14667957.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (377, 'BUSINESS-DEVELOPMENT', '11958994.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (378, 'HR', '13115648.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (379, 'DESIGNER', '15573418.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (380, 'HEALTHCARE', '16426777.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (381, 'SALES', '14267489.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (382, 'FITNESS', '10751444.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (383, 'BUSINESS-DEVELOPMENT', '14225422.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (384, 'ADVOCATE', '13998435.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (385, 'SALES', '11155153.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (386, 'INFORMATION-TECHNOLOGY', '11842274.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (387, 'DESIGNER', '10909673.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (388, 'ENGINEER', '10138632.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (389, 'DESIGNER', '11169163.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (390, 'DESIGNER', '13593241.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (391, 'HEALTHCARE', '12374933.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (392, 'FITNESS', '15575117.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (393, 'BUSINESS-DEVELOPMENT', '10176013.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (394, 'FITNESS', '10818478.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (395, 'INFORMATION-TECHNOLOGY', '15601399.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (396, 'TEACHER', '14128006.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (397, 'SALES', '12567516.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (398, 'ADVOCATE', '11919526.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (399, 'CONSULTANT', '15850434.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (400, 'FITNESS', '11270462.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (401, 'ENGINEER', '10235429.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (402, 'ENGINEER', '13037145.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (403, 'CONSULTANT', '15375009.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (404, 'ENGINEER', '79261033.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (405, 'HEALTHCARE', '10062724.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (406, 'HR', '10909720.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (407, 'ACCOUNTANT', '12415691.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (408, 'HR', '3547447.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (409, 'HEALTHCARE', '17775916.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (410, 'HEALTHCARE', '13212436.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (411, 'BUSINESS-DEVELOPMENT', '14206561.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (412, 'TEACHER', '17325147.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (413, 'CONSULTANT', '13964744.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (414, 'FITNESS', '13264154.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (415, 'INFORMATION-TECHNOLOGY', '11584809.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (416, 'BUSINESS-DEVELOPMENT', '16820422.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (417, 'ADVOCATE', '17311685.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (418, 'TEACHER', '11409460.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (419, 'HEALTHCARE', '12632728.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (420, 'DESIGNER', '12122372.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (421, 'HR', '13855004.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (422, 'FITNESS', '10228751.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (423, 'INFORMATION-TECHNOLOGY', '16276121.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (424, 'ADVOCATE', '14945250.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (425, 'ACCOUNTANT', '11551946.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (426, 'ENGINEER', '11188218.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (427, 'FITNESS', '10945968.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (428, 'FITNESS', '10100240.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (429, 'INFORMATION-TECHNOLOGY', '13264796.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (430, 'HEALTHCARE', '13272204.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (431, 'SALES', '13330982.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (432, 'ADVOCATE', '12442909.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (433, 'TEACHER', '12923795.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (434, 'HR', '11842348.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (435, 'DESIGNER', '10953078.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (436, 'FITNESS', '15792052.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (437, 'HEALTHCARE', '10839851.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (438, 'SALES', '15273850.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (439, 'INFORMATION-TECHNOLOGY', '16244633.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (440, 'CONSULTANT', '11332602.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (441, 'HEALTHCARE', '14181049.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (442, 'HR', '11393213.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (443, 'DESIGNER', '13294301.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (444, 'HR', '10247517.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (445, 'HR', '11943065.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (446, 'ENGINEER', '16852973.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (447, 'ACCOUNTANT', '12071138.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (448, 'INFORMATION-TECHNOLOGY', '10694288.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (449, 'HEALTHCARE', '13129275.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (450, 'ADVOCATE', '17033567.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (451, 'FITNESS', '11959428.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (452, 'BUSINESS-DEVELOPMENT', '12791244.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (453, 'FITNESS', '14413257.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (454, 'SALES', '13095891.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (455, 'BUSINESS-DEVELOPMENT', '45077654.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (456, 'HR', '12334140.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (457, 'DESIGNER', '10653119.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (458, 'TEACHER', '12043694.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (459, 'FITNESS', '12491898.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (460, 'DESIGNER', '11773925.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (461, 'ACCOUNTANT', '14517953.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (462, 'TEACHER', '10840430.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (463, 'CONSULTANT', '11183737.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (464, 'ADVOCATE', '14055971.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (465, 'CONSULTANT', '12021752.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (466, 'BUSINESS-DEVELOPMENT', '10568350.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (467, 'SALES', '11807040.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (468, 'ACCOUNTANT', '11415967.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (469, 'TEACHER', '14761906.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (470, 'HR', '11336022.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (471, 'ACCOUNTANT', '11444536.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (472, 'HR', '12092347.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (473, 'FITNESS', '14449423.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (474, 'INFORMATION-TECHNOLOGY', '13491889.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (475, 'CONSULTANT', '12897903.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (476, 'INFORMATION-TECHNOLOGY', '18242317.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (477, 'FITNESS', '10001727.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (478, 'BUSINESS-DEVELOPMENT', '10568183.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (479, 'BUSINESS-DEVELOPMENT', '11088337.pdf');
-INSERT INTO ApplicationDetail (applicant_id, application_role, cv_path) VALUES (480, 'HR', '14771530.pdf');
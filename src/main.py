@@ -1,8 +1,10 @@
 import multiprocessing
 import time
 import os
+import secrets
+import socket
 import sys
-import requests
+import threading
 
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
 if 'src' not in PROJECT_ROOT: 
@@ -12,28 +14,62 @@ else:
      sys.path.append(os.path.dirname(PROJECT_ROOT))
 
 
-from api.app import app
-from ui.flet_frontend import start_gui # Updated import
+# Heavy imports (Flask app, Flet GUI, requests) are done where they are used so
+# each process only loads what it needs.
 from config import API_HOST, API_PORT
 
 
-def start_backend():
+def start_backend(shutdown_token=None):
     print("[Main] Starting backend API server in a background process...")
 
-    app.run(host=API_HOST, port=API_PORT, debug=False)
+    from waitress import create_server
+    from api.app import app, database_manager, shutdown_requested
+
+    # /shutdown only accepts this launch's token; without one it stays disabled
+    app.config["SHUTDOWN_TOKEN"] = shutdown_token
+    server = create_server(app, host=API_HOST, port=API_PORT, threads=8)
+    threading.Thread(target=server.run, daemon=True).start()
+
+    # Block until the GUI asks for /shutdown, then release resources ourselves
+    # instead of being killed with them still open.
+    shutdown_requested.wait()
+    print("[Main] Backend shutdown requested, closing resources...")
+    server.close()
+    database_manager.close()
+
+
+def stop_backend(backend_process, shutdown_token):
+    import requests
+
+    try:
+        requests.post(
+            f"http://{API_HOST}:{API_PORT}/shutdown",
+            headers={"X-Shutdown-Token": shutdown_token},
+            timeout=2,
+        )
+    except requests.exceptions.RequestException:
+        pass
+
+    backend_process.join(timeout=5)
+    if backend_process.is_alive():
+        print("[Main] Backend did not stop in time, terminating it.")
+        backend_process.terminate()
+        backend_process.join()
+
 
 def wait_for_backend():
     print("[Main] Waiting for backend to become available...")
     start_time = time.time()
+    delay = 0.01
     while time.time() - start_time < 30:
+        # A bare TCP connect is enough to know the server is listening
         try:
-            response = requests.get(f"http://{API_HOST}:{API_PORT}/status", timeout=1)
-            if response.status_code == 200:
+            with socket.create_connection((API_HOST, API_PORT), timeout=0.1):
                 print("[Main] Backend is ready!")
                 return True
-        except requests.exceptions.RequestException:
-
-            time.sleep(0.5)
+        except OSError:
+            time.sleep(delay)
+            delay = min(delay * 2, 0.5)
     
     print("[Main] Error: Backend did not start within the timeout period.")
     return False
@@ -42,15 +78,19 @@ def wait_for_backend():
 if __name__ == '__main__':
     print("[Main] Launching application...")
 
-    backend_process = multiprocessing.Process(target=start_backend, daemon=True)
+    shutdown_token = secrets.token_urlsafe(32)
+    backend_process = multiprocessing.Process(
+        target=start_backend, args=(shutdown_token,), daemon=True
+    )
     backend_process.start()
 
     if wait_for_backend():
+        from ui.flet_frontend import start_gui
+
         start_gui()
     
     print("[Main] GUI closed. Shutting down backend server...")
     if backend_process.is_alive():
-        backend_process.terminate()
-        backend_process.join()
+        stop_backend(backend_process, shutdown_token)
 
     print("[Main] Application has shut down cleanly.")
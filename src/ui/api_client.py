@@ -3,27 +3,121 @@
 # This file contains the ApiClient class, which handles all HTTP
 # communication with the backend Flask server.
 
-import requests
-from typing import Dict, Any, Optional
+import logging
+import platform
+import threading
+from collections import OrderedDict
+
+import httpx
+from typing import AsyncIterator, Dict, Any, Optional
+
+# orjson ships no PyPy wheels; the stdlib json module is fast enough under the JIT
+if platform.python_implementation() == "PyPy":
+    import json
+
+    JSONDecodeError = json.JSONDecodeError
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+else:
+    import orjson
+
+    JSONDecodeError = orjson.JSONDecodeError
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
 
 # We need to import the config from the project's root
 from config import API_HOST, API_PORT
 
+logger = logging.getLogger(__name__)
+
+# Sent on every request; the backend gzips larger JSON responses
+DEFAULT_HEADERS = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+
+# Payloads are pre-encoded with json_dumps, so the content type is set by hand
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# How long an idle pooled connection is kept (seconds). httpx defaults to 5s,
+# which drops the status poller's connection before the user's first search;
+# waitress closes idle channels after 120s.
+KEEPALIVE_EXPIRY = 60.0
+
+# Number of /summary responses kept in memory for repeat visits
+SUMMARY_CACHE_SIZE = 64
+
 
 class ApiClient:
     def __init__(self):
         self.base_url = f"http://{API_HOST}:{API_PORT}"
 
-    def get_status(self) -> Optional[Dict[str, Any]]:
+        # One pooled async client so status polls and searches reuse keep-alive
+        # connections and never block the Flet event loop while waiting.
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=DEFAULT_HEADERS,
+            timeout=httpx.Timeout(30.0, connect=2.0),
+            # Limits go on the transport; the client ignores them when a
+            # transport is passed in.
+            transport=httpx.AsyncHTTPTransport(
+                retries=2,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=10,
+                    keepalive_expiry=KEEPALIVE_EXPIRY,
+                ),
+            ),
+        )
+
+        # Last /status body and its ETag, replayed when the server answers 304
+        self._status_etag: Optional[str] = None
+        self._last_status: Optional[Dict[str, Any]] = None
+
+        # LRU of /summary responses keyed by detail_id
+        self._summary_cache: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._summary_lock = threading.Lock()
+
+    async def get_status(self) -> Optional[Dict[str, Any]]:
         try:
-            response = requests.get(f"{self.base_url}/status", timeout=1)
+            headers = {}
+            if self._status_etag and self._last_status is not None:
+                headers["If-None-Match"] = self._status_etag
+            response = await self._client.get("/status", headers=headers, timeout=1)
+            if response.status_code == 304:
+                return self._last_status
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"[ApiClient Error] Could not connect: {e}")
+            self._status_etag = response.headers.get("ETag")
+            self._last_status = json_loads(response.content)
+            return self._last_status
+        except (httpx.HTTPError, JSONDecodeError) as e:
+            logger.warning("Could not connect: %s", e)
             return None
 
-    def search(
+    async def stream_status(self) -> AsyncIterator[Dict[str, Any]]:
+        """Yields statuses pushed on /status/stream until the server ends it.
+
+        Errors end the stream quietly; callers fall back to polling.
+        """
+        try:
+            async with self._client.stream("GET", "/status/stream") as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    # Comment lines (": keep-alive") and blank separators are skipped
+                    if line.startswith("data:"):
+                        yield json_loads(line[5:])
+        except (httpx.HTTPError, JSONDecodeError) as e:
+            logger.warning("Status stream failed: %s", e)
+
+    async def get_status_head(self) -> bool:
+        """Cheap reachability probe; no body is sent back."""
+        try:
+            response = await self._client.head("/status", timeout=0.5)
+            return response.is_success
+        except httpx.HTTPError:
+            return False
+
+    async def search(
         self, keywords: str, algorithm: str, num_matches: int
     ) -> Optional[Dict[str, Any]]:
         payload = {
@@ -32,25 +126,58 @@ class ApiClient:
             "num_top_matches": num_matches,
         }
         try:
-            response = requests.post(
-                f"{self.base_url}/search", json=payload, timeout=300
+            response = await self._client.post(
+                "/search",
+                content=json_dumps(payload),
+                headers=JSON_HEADERS,
+                timeout=300,
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"[ApiClient Error] Search failed: {e}")
+            return json_loads(response.content)
+        except (httpx.HTTPError, JSONDecodeError) as e:
+            logger.warning("Search failed: %s", e)
             return None
 
-    def get_summary(self, detail_id: int) -> Optional[Dict[str, Any]]:
+    async def get_summary(self, detail_id: int) -> Optional[Dict[str, Any]]:
+        with self._summary_lock:
+            cached = self._summary_cache.get(detail_id)
+            if cached is not None:
+                self._summary_cache.move_to_end(detail_id)
+                return cached
+
         try:
-            response = requests.get(f"{self.base_url}/summary/{detail_id}", timeout=10)
+            response = await self._client.get(f"/summary/{detail_id}", timeout=10)
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"[ApiClient Error] Summary request failed: {e}")
+            summary = json_loads(response.content)
+        except (httpx.HTTPError, JSONDecodeError) as e:
+            logger.warning("Summary request failed: %s", e)
             return None
 
-    def search_multiple_patterns(
+        with self._summary_lock:
+            self._summary_cache[detail_id] = summary
+            self._summary_cache.move_to_end(detail_id)
+            if len(self._summary_cache) > SUMMARY_CACHE_SIZE:
+                self._summary_cache.popitem(last=False)
+        return summary
+
+    async def prefetch_summaries(self, detail_ids: list[int]):
+        """Warms the summary cache for search results in the background."""
+        # One request at a time: every /summary hits the backend's single
+        # shared DB connection, so a burst would only queue up behind it and
+        # hold waitress threads a user's /search needs. Never prefetch more
+        # than the cache can hold, or the first entries are evicted by the last.
+        for detail_id in detail_ids[:SUMMARY_CACHE_SIZE]:
+            await self.get_summary(detail_id)
+
+    def invalidate_summary(self, detail_id: int):
+        with self._summary_lock:
+            self._summary_cache.pop(detail_id, None)
+
+    def clear_summaries(self):
+        with self._summary_lock:
+            self._summary_cache.clear()
+
+    async def search_multiple_patterns(
         self, patterns: list[str], algorithm: str, num_matches: int
     ) -> Optional[Dict[str, Any]]:
         payload = {
@@ -59,11 +186,33 @@ class ApiClient:
             "num_top_matches": num_matches,
         }
         try:
-            response = requests.post(
-                f"{self.base_url}/search_multiple", json=payload, timeout=300
+            response = await self._client.post(
+                "/search_multiple",
+                content=json_dumps(payload),
+                headers=JSON_HEADERS,
+                timeout=300,
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            print(f"[ApiClient Error] Multiple pattern search failed: {e}")
+            return json_loads(response.content)
+        except (httpx.HTTPError, JSONDecodeError) as e:
+            logger.warning("Multiple pattern search failed: %s", e)
             return None
+
+    async def close(self):
+        await self._client.aclose()
+
+
+# One client per process, so every Flet session shares the same pool. It is
+# never closed explicitly: its connections belong to the Flet event loop, which
+# is already gone at interpreter exit, and the OS reclaims the sockets then.
+_api_client: Optional[ApiClient] = None
+_api_client_lock = threading.Lock()
+
+
+def get_api_client() -> ApiClient:
+    """Returns the process-wide ApiClient, creating it on first use."""
+    global _api_client
+    with _api_client_lock:
+        if _api_client is None:
+            _api_client = ApiClient()
+        return _api_client
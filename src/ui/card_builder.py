@@ -0,0 +1,120 @@
+# src/ui/card_builder.py
+
+# This file builds the search result cards shown on the main view. It holds no
+# page state and is fully annotated, so it can run on a worker thread or be
+# compiled with mypyc as-is.
+
+from typing import Any, Callable, Dict, List, Tuple
+
+import flet as ft
+
+# A pooled card and references to the controls that change between searches
+PooledCard = Tuple[ft.Card, Dict[str, ft.Control]]
+ClickHandler = Callable[[ft.ControlEvent], None]
+
+# Shared layout kwargs, built once instead of per card
+_ROW5: Dict[str, Any] = {"spacing": 5}
+_ROW_END: Dict[str, Any] = {"alignment": ft.MainAxisAlignment.END}
+_COL8: Dict[str, Any] = {"spacing": 8}
+_COL2: Dict[str, Any] = {"spacing": 2}
+
+
+def new_result_card(
+    on_view_cv: ClickHandler,
+    on_view_summary: ClickHandler,
+) -> PooledCard:
+    """Creates an empty result card plus references to its variable controls.
+
+    Both buttons share page-wide handlers that read the detail_id from
+    ``e.control.data``, so rebinding a card never allocates a closure.
+    """
+    bindings: Dict[str, ft.Control] = {
+        "name": ft.Text(style=ft.TextThemeStyle.TITLE_MEDIUM, weight=ft.FontWeight.BOLD),
+        "role": ft.Text(color=ft.Colors.BLUE_GREY_700),
+        "total": ft.Text(size=14),
+        "match_type": ft.Text(size=14),
+        "keywords": ft.Column(**_COL2),
+        "view_cv": ft.OutlinedButton(
+            "View CV", icon=ft.Icons.PICTURE_AS_PDF_OUTLINED, on_click=on_view_cv
+        ),
+        "view_summary": ft.FilledButton(
+            "View Summary",
+            icon=ft.Icons.VISIBILITY_OUTLINED,
+            on_click=on_view_summary,
+        ),
+    }
+    bindings["container"] = ft.Container(
+        ft.Column(
+            [
+                bindings["name"],
+                bindings["role"],
+                ft.Divider(height=5, color="transparent"),
+                ft.Row(
+                    [
+                        ft.Icon(
+                            ft.Icons.CHECK_CIRCLE_OUTLINED,
+                            color=ft.Colors.GREEN_500,
+                            size=16,
+                        ),
+                        bindings["total"],
+                        ft.Icon(ft.Icons.TAG, size=16),
+                        bindings["match_type"],
+                    ],
+                    **_ROW5,
+                ),
+                ft.Divider(height=10),
+                ft.Text("Keywords Matched:", weight=ft.FontWeight.BOLD),
+                bindings["keywords"],
+                ft.Container(expand=True),
+                ft.Row(
+                    [bindings["view_cv"], bindings["view_summary"]],
+                    **_ROW_END,
+                ),
+            ],
+            **_COL8,
+        ),
+        padding=20,
+        border_radius=10,
+    )
+    return ft.Card(bindings["container"]), bindings
+
+
+def build_cards(
+    results: List[Dict[str, Any]],
+    card_width: int,
+    card_pool: List[PooledCard],
+    on_view_cv: ClickHandler,
+    on_view_summary: ClickHandler,
+    start: int = 0,
+) -> List[ft.Card]:
+    """Binds search results onto pooled cards, growing the pool if needed.
+
+    ``start`` is the rank of the first result, so later pages of the same
+    search land on the next pool slots and keep their numbering.
+    Touches no page state, so it is safe to run off the UI thread.
+    """
+    while len(card_pool) < start + len(results):
+        card_pool.append(new_result_card(on_view_cv, on_view_summary))
+
+    cards: List[ft.Card] = []
+    for i, result in enumerate(results, start):
+        card, bindings = card_pool[i]
+        detail_id = result.get("detail_id")
+        matched_keywords = result.get("matched_keywords", {})
+
+        bindings["name"].value = f"{i + 1}. {result.get('applicant_name', 'N/A')}"
+        bindings["role"].value = f"Role: {result.get('application_role', 'N/A')}"
+        bindings["total"].value = f"Total Matches: {result.get('total_matches', 0)}"
+        bindings["match_type"].value = f"Match Type: {result.get('match_type', 'N/A')}"
+        if matched_keywords:
+            bindings["keywords"].controls = [
+                ft.Text(f"{kw_idx+1}. {key} ({value})")  # 'value' is the count
+                for kw_idx, (key, value) in enumerate(matched_keywords.items())
+            ]
+        else:
+            bindings["keywords"].controls = [ft.Text("None")]
+        bindings["view_cv"].data = detail_id
+        bindings["view_summary"].data = detail_id
+        bindings["container"].width = card_width
+        cards.append(card)
+    return cards
@@ -1,12 +1,35 @@
-import flet as ft
-import time
+import asyncio
+import logging
+import platform
+import re
+from collections import OrderedDict
+from contextlib import aclosing
+from typing import TYPE_CHECKING
 
+# flet, httpx and the views are imported inside the functions below, so
+# importing this module (e.g. from main.py) stays cheap until the GUI starts.
+if TYPE_CHECKING:
+    import flet as ft
 
-from src.ui.api_client import ApiClient
-from src.ui.views import build_main_view, build_summary_view
+logger = logging.getLogger(__name__)
 
+_SUMMARY_RE = re.compile(r"^/summary/(\d+)$")
+
+# /status polling delay bounds (seconds) and growth factor while unchanged
+POLL_MIN_DELAY = 0.2
+POLL_MAX_DELAY = 2.0
+POLL_BACKOFF = 1.6
+
+# Number of built summary views kept for revisits
+SUMMARY_VIEW_CACHE_SIZE = 32
+
+
+def main_flet_app(page: "ft.Page"):
+    import flet as ft
+
+    from src.ui.api_client import get_api_client
+    from src.ui.views import build_main_view, build_summary_view, show_loading_view
 
-def main_flet_app(page: ft.Page):
     page.title = "CV Analyzer"
     page.theme_mode = ft.ThemeMode.LIGHT
     page.theme = ft.Theme(color_scheme_seed="blue_grey", font_family="Roboto")
@@ -16,50 +39,110 @@ def main_flet_app(page: ft.Page):
     page.window_min_height = 800
     page.padding = 0
 
-    api_client = ApiClient()
+    api_client = get_api_client()
+
 
+    search_state = {
+        "last_response": None,
+        "last_cards": None,
+        "card_pool": [],
+        "summary_views": OrderedDict(),
+        "search_cache": OrderedDict(),
+        "main_view": None,
+    }
 
-    search_state = {"last_response": None}
+    # Set when the page closes so the status poller stops without another
+    # request or a page.update() on a dead session.
+    stop_polling = asyncio.Event()
+
+    async def stopped_within(delay: float) -> bool:
+        """Sleeps for delay seconds, returning True early if polling was stopped."""
+        try:
+            await asyncio.wait_for(stop_polling.wait(), delay)
+            return True
+        except asyncio.TimeoutError:
+            return False
 
     def build_initial_loading_view() -> ft.View:
         progress_bar = ft.ProgressBar(width=400, value=0)
         status_text = ft.Text("Connecting to backend...")
 
-        def check_backend_status():
-            print("[GUI] Started polling for backend status...")
+        def show_status(status) -> bool:
+            """Renders one status update; returns True once parsing is done."""
+            parsed = status.get("parsed_count", 0)
+            total = status.get("total_count", 1)
+            is_done = status.get("is_done", False)
             
-            while True:
-                status = api_client.get_status()
+
+            status_text.value = f"Parsing CVs: {parsed} / {total}"
+            progress_bar.value = parsed / total if total > 0 else 0
+            
+            logger.debug("Status: %s/%s, is_done: %s", parsed, total, is_done)
+            
+
+            # Only these two controls change; don't resend the view
+            page.update(status_text, progress_bar)
+            
+
+            if is_done:
+                logger.debug("Backend reported parsing is complete. Navigating to main view.")
+                # Summaries are built from parsed CVs, drop anything
+                # fetched while parsing was still running.
+                api_client.clear_summaries()
+                page.go("/")
+            return is_done
+
+        async def check_backend_status():
+            # The backend pushes each change on /status/stream; polling is only
+            # the fallback when the stream can't be opened or drops.
+            logger.debug("Following backend status stream...")
+            async with aclosing(api_client.stream_status()) as statuses:
+                async for status in statuses:
+                    if stop_polling.is_set() or show_status(status):
+                        return
+            if stop_polling.is_set():
+                return
+
+            logger.debug("Started polling for backend status...")
+            last_status = None
+            # Poll quickly while the counts move and back off (x1.6, up to
+            # 2s) while they don't; any change resets the delay.
+            poll_delay = POLL_MIN_DELAY
+
+            while not stop_polling.is_set():
+                status = await api_client.get_status()
+                if stop_polling.is_set():
+                    return
+                if status and status == last_status:
+                    # Unchanged (304 from the backend), nothing to redraw
+                    if await stopped_within(poll_delay):
+                        return
+                    poll_delay = min(poll_delay * POLL_BACKOFF, POLL_MAX_DELAY)
+                    continue
+                last_status = status
                 if status:
-                    parsed = status.get("parsed_count", 0)
-                    total = status.get("total_count", 1)
-                    is_done = status.get("is_done", False)
-                    
-
-                    status_text.value = f"Parsing CVs: {parsed} / {total}"
-                    progress_bar.value = parsed / total if total > 0 else 0
-                    
-                    print(f"[GUI] Status: {parsed}/{total}, is_done: {is_done}")  # Debug log
-                    
-
-                    page.update()
-                    
-
-                    if is_done:
-                        print("[GUI] Backend reported parsing is complete. Navigating to main view.")
-                        page.go("/")
+                    if show_status(status):
                         break
                 else:
                     status_text.value = "Backend is unavailable. Retrying..."
-                    page.update()
-                
+                    page.update(status_text)
 
-                time.sleep(1)
+                    # Wait for the listener with HEAD probes on the shared
+                    # client, backing off 0.1s, 0.2s, 0.4s... up to 2s.
+                    probe_delay = 0.1
+                    while not await api_client.get_status_head():
+                        if await stopped_within(probe_delay):
+                            return
+                        probe_delay = min(probe_delay * 2, 2.0)
+                    poll_delay = POLL_MIN_DELAY
+                    continue
+                
 
-            print("[GUI] Backend reported parsing is complete. Navigating to main view.")
-            page.go("/")
+                poll_delay = POLL_MIN_DELAY
+                if await stopped_within(poll_delay):
+                    return
 
-        page.run_thread(check_backend_status)
+        page.run_task(check_backend_status)
 
         return ft.View(
             "/loading",
@@ -84,15 +167,46 @@ def main_flet_app(page: ft.Page):
             ],
         )
 
+    async def load_summary(detail_id: int):
+        response = await api_client.get_summary(detail_id)
+        route = f"/summary/{detail_id}"
+        # The user may have navigated elsewhere while the request was in flight
+        if page.route != route or not page.views or page.views[-1].route != route:
+            return
+        view = build_summary_view(page, detail_id, response)
+        if response:
+            summary_views = search_state["summary_views"]
+            summary_views[detail_id] = view
+            if len(summary_views) > SUMMARY_VIEW_CACHE_SIZE:
+                summary_views.popitem(last=False)
+        page.views[-1] = view
+        page.update()
+
     def route_change(route):
         page.views.clear()
 
+        summary_match = _SUMMARY_RE.match(page.route)
         if page.route == "/":
-            page.views.append(build_main_view(page, api_client, search_state))
-        elif page.route.startswith("/summary/"):
-            page.views.append(
-                build_summary_view(page, api_client, int(page.route.split("/")[-1]))
-            )
+            # Built once per session; the view keeps its own inputs and results,
+            # so coming back from a summary page just reattaches it.
+            if search_state["main_view"] is None:
+                search_state["main_view"] = build_main_view(
+                    page, api_client, search_state
+                )
+            page.views.append(search_state["main_view"])
+        elif summary_match:
+            # Show the page immediately and fill it in once the fetch returns
+            detail_id = int(summary_match.group(1))
+            summary_views = search_state["summary_views"]
+            if detail_id in summary_views:
+                # Revisit: reuse the view built last time
+                summary_views.move_to_end(detail_id)
+                page.views.append(summary_views[detail_id])
+            else:
+                page.views.append(
+                    show_loading_view("Loading summary...", route=page.route)
+                )
+                page.run_task(load_summary, detail_id)
         else:
             page.views.append(build_initial_loading_view())
 
@@ -106,11 +220,48 @@ def main_flet_app(page: ft.Page):
     page.on_route_change = route_change
     page.on_view_pop = view_pop
 
+    # The shared client outlives this session, so only the poller is stopped.
+    # async so Flet runs it on the event loop: asyncio.Event isn't thread-safe.
+    async def on_close(e):
+        stop_polling.set()
+
+    page.on_close = on_close
+
 
     page.go("/loading")
 
 
+def _warm_up_card_builder(rounds: int = 50):
+    """Runs build_cards on dummy results so PyPy has traced it before the first search."""
+    from src.ui.card_builder import build_cards
+
+    dummy_results = [
+        {
+            "detail_id": i,
+            "applicant_name": "Warm Up",
+            "application_role": "N/A",
+            "total_matches": 1,
+            "match_type": "exact",
+            "matched_keywords": {"python": 1},
+        }
+        for i in range(10)
+    ]
+    card_pool = []
+    noop = lambda _: None
+    for _ in range(rounds):
+        build_cards(dummy_results, 200, card_pool, noop, noop)
+
+
 def start_gui(use_web_browser: bool = False):
+    import flet as ft
+
     print("[Main] Launching Flet GUI application...")
+    if platform.python_implementation() == "PyPy":
+        _warm_up_card_builder()
     view_mode = ft.WEB_BROWSER if use_web_browser else ft.FLET_APP
     ft.app(target=main_flet_app, view=view_mode, assets_dir="assets")
+
+
+if __name__ == "__main__":
+    # Used by launch_pypy.sh, which starts the backend separately
+    start_gui()
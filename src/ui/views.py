@@ -1,16 +1,46 @@
+import functools
+import logging
+import os
+import subprocess
+import time
 import flet as ft
-from typing import Any, Dict
-from functools import partial
+from typing import Any, Dict, List, Optional
 import math
 
+from config import DEFAULT_TOP_N_MATCHES
 from src.ui.api_client import ApiClient
+from src.ui.card_builder import build_cards
+
+logger = logging.getLogger(__name__)
+
+# Detected once; under WSL the PDF is opened with the Windows browser
+_IS_WSL = hasattr(os, "uname") and "microsoft" in os.uname().release.lower()
 
 GRID_COLUMNS = 3  
+DEFAULT_PAGE_WIDTH = 800
+MIN_CARD_WIDTH = 200
+PAGE_PADDING = 40  # horizontal padding of the main view
+CARD_SPACING = 15  # gap between result cards, across and between rows
+MAX_TOP_N = 100
+
+# Identical searches within the TTL reuse the stored response
+SEARCH_CACHE_SIZE = 16
+SEARCH_CACHE_TTL = 300  # seconds
 
+# Shared theme values, resolved once rather than on every view build
+_COLOR_HEADER = ft.Colors.ON_SURFACE_VARIANT
+_COLOR_PAGE_BG = ft.Colors.BLUE_GREY_50
+_COLOR_MUTED = ft.Colors.BLUE_GREY_400
+_STYLE_TITLE_M = ft.TextThemeStyle.TITLE_MEDIUM
+_WEIGHT_BOLD = ft.FontWeight.BOLD
 
-def show_loading_view(message: str) -> ft.View:
+# Result cards rendered per batch; the rest wait behind "Load more"
+PAGE_SIZE = 12
+
+
+def show_loading_view(message: str, route: str = "/loading") -> ft.View:
     return ft.View(
-        "/loading",
+        route,
         [
             ft.Column(
                 [
@@ -27,15 +57,28 @@ def show_loading_view(message: str) -> ft.View:
     )
 
 
-def build_summary_view(page: ft.Page, api_client: ApiClient, detail_id: int) -> ft.View:
-    response = api_client.get_summary(detail_id)
-    print (response)
+def _card(*children: ft.Control, padding: int = 20) -> ft.Card:
+    """Padded card holding a single column of controls."""
+    return ft.Card(ft.Container(ft.Column(list(children), spacing=10), padding=padding))
+
+
+def _section_card(title: str, body: List[ft.Control]) -> ft.Card:
+    """Summary section: a titled card over the given body controls."""
+    return _card(ft.Text(title, style=_STYLE_TITLE_M), *body)
+
+
+def build_summary_view(
+    page: ft.Page, detail_id: int, response: Optional[Dict[str, Any]]
+) -> ft.View:
+    """Builds the summary page from an already fetched /summary response."""
+    # Lazy %-formatting: the response dict is only rendered with DEBUG enabled
+    logger.debug("Summary response for %s: %s", detail_id, response)
 
     if not response:
         return ft.View(
             f"/summary/{detail_id}",
             [
-                ft.AppBar(title=ft.Text("Error"), bgcolor=ft.Colors.ON_SURFACE_VARIANT),
+                ft.AppBar(title=ft.Text("Error"), bgcolor=_COLOR_HEADER),
                 ft.Text(
                     "Could not retrieve summary for that ID.", color="red", size=18
                 ),
@@ -45,8 +88,8 @@ def build_summary_view(page: ft.Page, api_client: ApiClient, detail_id: int) ->
     def info_row(icon: str, label: str, value: Any):
         return ft.Row(
             [
-                ft.Icon(name=icon, color=ft.Colors.BLUE_GREY_400, size=20),
-                ft.Text(label, weight=ft.FontWeight.BOLD, size=14, width=120),
+                ft.Icon(name=icon, color=_COLOR_MUTED, size=20),
+                ft.Text(label, weight=_WEIGHT_BOLD, size=14, width=120),
                 ft.Text(
                     str(value) if value else "N/A",
                     selectable=True,
@@ -57,23 +100,10 @@ def build_summary_view(page: ft.Page, api_client: ApiClient, detail_id: int) ->
             spacing=15,
         )
 
-    personal_card = ft.Card(
-        ft.Container(
-            ft.Column(
-                [
-                    info_row(
-                        ft.Icons.PERSON_OUTLINED, "Birthdate", response.get("birthdate")
-                    ),
-                    info_row(
-                        ft.Icons.HOME_OUTLINED, "Address", response.get("address")
-                    ),
-                    info_row(
-                        ft.Icons.PHONE_OUTLINED, "Phone", response.get("phone_number")
-                    ),
-                ]
-            ),
-            padding=20,
-        )
+    personal_card = _card(
+        info_row(ft.Icons.PERSON_OUTLINED, "Birthdate", response.get("birthdate")),
+        info_row(ft.Icons.HOME_OUTLINED, "Address", response.get("address")),
+        info_row(ft.Icons.PHONE_OUTLINED, "Phone", response.get("phone_number")),
     )
 
     skills_list = response.get("skills", [])
@@ -82,22 +112,16 @@ def build_summary_view(page: ft.Page, api_client: ApiClient, detail_id: int) ->
         if skills_list
         else [ft.Text("No skills listed.")]
     )
-    skills_card = ft.Card(
-        ft.Container(
-            ft.Column(
-                [
-                    ft.Text("Skills", style=ft.TextThemeStyle.TITLE_MEDIUM),
-                    ft.Row(controls=skill_chips, wrap=True),
-                ]
-            ),
-            padding=20,
-        )
+    skills_card = _section_card(
+        "Skills",
+        # Chips go straight into the wrapping row, which does the spacing
+        [ft.Row(controls=skill_chips, wrap=True, spacing=10, run_spacing=10)],
     )
 
     job_history_items = [
         ft.Column(
             [
-                ft.Text(job.get('title', 'N/A'), weight=ft.FontWeight.BOLD),
+                ft.Text(job.get('title', 'N/A'), weight=_WEIGHT_BOLD),
 
                 *[
                     ft.Text(f"- {desc}", size=14)
@@ -113,23 +137,12 @@ def build_summary_view(page: ft.Page, api_client: ApiClient, detail_id: int) ->
     if not job_history_items:
         job_history_items.append(ft.Text("No job history listed."))
 
-    work_card = ft.Card(
-        ft.Container(
-            ft.Column(
-                [
-                    ft.Text("Work Experience", style=ft.TextThemeStyle.TITLE_MEDIUM),
-                    *job_history_items
-                ],
-                spacing=10,
-            ),
-            padding=20,
-        )
-    )
+    work_card = _section_card("Work Experience", job_history_items)
 
     education_items = [
         ft.Column(
             [
-                ft.Text(f"{i+1}. {edu.get('degree', 'N/A')}", weight=ft.FontWeight.BOLD),
+                ft.Text(f"{i+1}. {edu.get('degree', 'N/A')}", weight=_WEIGHT_BOLD),
             ],
             spacing=2,
         )
@@ -138,25 +151,14 @@ def build_summary_view(page: ft.Page, api_client: ApiClient, detail_id: int) ->
     if not education_items:
         education_items.append(ft.Text("No education history listed."))
 
-    education_card = ft.Card(
-        ft.Container(
-            ft.Column(
-                [
-                    ft.Text("Education", style=ft.TextThemeStyle.TITLE_MEDIUM),
-                    *education_items,
-                ],
-                spacing=10,
-            ),
-            padding=20,
-        )
-    )
+    education_card = _section_card("Education", education_items)
 
     return ft.View(
         f"/summary/{detail_id}",
         [
             ft.AppBar(
                 title=ft.Text(response.get("applicant_name", "CV Summary")),
-                bgcolor=ft.Colors.ON_SURFACE_VARIANT,
+                bgcolor=_COLOR_HEADER,
                 leading=ft.IconButton(
                     icon=ft.Icons.ARROW_BACK, on_click=lambda _: page.go("/")
                 ),
@@ -169,7 +171,17 @@ def build_summary_view(page: ft.Page, api_client: ApiClient, detail_id: int) ->
             ),
         ],
         padding=20,
-        bgcolor=ft.Colors.BLUE_GREY_50,
+        bgcolor=_COLOR_PAGE_BG,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _compute_card_width(page_width: int, columns: int) -> int:
+    """Card width for a results row; cached since the window is rarely resized."""
+    total_spacing = (columns - 1) * CARD_SPACING
+    return max(
+        MIN_CARD_WIDTH,
+        math.floor((page_width - PAGE_PADDING - total_spacing) / columns) - 15,
     )
 
 
@@ -197,137 +209,82 @@ def build_main_view(
         border_radius=8,
         width=120,
     )
-    top_n_input = ft.TextField(label="Top N", value="5", width=90, border_radius=8)
+    top_n_input = ft.TextField(
+        label="Top N", value=str(DEFAULT_TOP_N_MATCHES), width=90, border_radius=8
+    )
     search_button = ft.FilledButton(text="Search", icon=ft.Icons.SEARCH, height=50)
 
-    results_view = ft.Row(wrap=True, spacing=15, run_spacing=15)
+    results_view = ft.Row(wrap=True, spacing=CARD_SPACING, run_spacing=CARD_SPACING)
+    # Persistent spinner shown in place of the results while a search runs
+    loading_container = ft.Container(
+        content=ft.Column(
+            [ft.ProgressRing(), ft.Text("Searching CVs...")],
+            horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            spacing=10,
+        ),
+        alignment=ft.alignment.center,
+        expand=True,
+        visible=False,
+    )
+    load_more_button = ft.OutlinedButton(
+        "Load more", icon=ft.Icons.EXPAND_MORE, visible=False
+    )
     results_container = ft.Column(
-        [results_view], expand=True, scroll=ft.ScrollMode.ADAPTIVE
+        [loading_container, results_view, load_more_button],
+        expand=True,
+        scroll=ft.ScrollMode.ADAPTIVE,
+        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
     )
     summary_text = ft.Text(italic=True, color=ft.Colors.BLUE_GREY_600)
 
-    def on_view_cv_click(e, detail_id):
+    def on_view_cv_click(e):
         """Handle View CV button click - open PDF via backend"""
+        detail_id = e.control.data
         pdf_url = f"http://127.0.0.1:5000/view_cv/{detail_id}"
-        print(f"[UI] Opening CV: {pdf_url}")
+        logger.debug("Opening CV: %s", pdf_url)
 
-        # For WSL - use Windows browser
-        import subprocess
-        import os
-
-        if "microsoft" in os.uname().release.lower():  # Detect WSL
+        if _IS_WSL:
             try:
                 # Use Windows browser from WSL
                 subprocess.run(["cmd.exe", "/c", "start", pdf_url], check=True)
             except:
-                print(f"[UI] Could not open browser. Please visit: {pdf_url}")
+                logger.warning("Could not open browser. Please visit: %s", pdf_url)
         else:
             # Normal Linux/Mac
             page.launch_url(pdf_url)
 
-    def _populate_results(response_data):
-        """Helper function to build result cards from API response data."""
-        results_view.controls.clear()
-        if response_data and response_data.get("search_results"):
-            summary_text.value = response_data.get("summary", "No performance summary.")
+    # Result cards are built once and rebound on later searches; a new card is
+    # only allocated when a search returns more results than the pool holds.
+    # The pool is kept in search_state next to last_cards, the cards bound
+    # from it for the current search.
+    card_pool = search_state["card_pool"]
 
-            num_results = len(response_data["search_results"])
-            effective_columns = min(GRID_COLUMNS, num_results)
-            effective_columns = max(1, effective_columns)
+    def go_to_summary(e):
+        page.go(f"/summary/{e.control.data}")
 
-            page_padding = 40
-            total_spacing = (effective_columns - 1) * results_view.spacing
-            card_width = (
-                math.floor(
-                    (page.width - page_padding - total_spacing) / effective_columns
-                )
-                - 15
-            )
-            i = 0
-            for i, result in enumerate(response_data["search_results"]):
-                detail_id = result.get("detail_id")
-                matched_keywords = result.get("matched_keywords", {})
-                keywords_column = ft.Column(spacing=2)
-                if matched_keywords:
-                    # Using a different variable for inner loop index to avoid confusion
-                    for kw_idx, (key, value) in enumerate(matched_keywords.items()):
-                        keywords_column.controls.append(
-                            ft.Text(
-                                f"{kw_idx+1}. {key} ({value})"
-                            )  # Assuming 'value' is the count
-                        )
-                else:
-                    keywords_column.controls.append(ft.Text("None"))
-
-                card = ft.Card(
-                    ft.Container(
-                        ft.Column(
-                            [
-                                ft.Text(
-                                    f"{i + 1}. {result.get('applicant_name', 'N/A')}",  # This line is now correct
-                                    style=ft.TextThemeStyle.TITLE_MEDIUM,
-                                    weight=ft.FontWeight.BOLD,
-                                ),
-                                ft.Text(
-                                    f"Role: {result.get('application_role', 'N/A')}",
-                                    color=ft.Colors.BLUE_GREY_700,
-                                ),
-                                ft.Divider(height=5, color="transparent"),
-                                ft.Row(
-                                    [
-                                        ft.Icon(
-                                            ft.Icons.CHECK_CIRCLE_OUTLINED,
-                                            color=ft.Colors.GREEN_500,
-                                            size=16,
-                                        ),
-                                        ft.Text(
-                                            f"Total Matches: {result.get('total_matches', 0)}",
-                                            size=14,
-                                        ),
-                                        ft.Icon(ft.Icons.TAG, size=16),
-                                        ft.Text(
-                                            f"Match Type: {result.get('match_type', 'N/A')}",
-                                            size=14,
-                                        ),
-                                    ],
-                                    spacing=5,
-                                ),
-                                ft.Divider(height=10),
-                                ft.Text("Keywords Matched:", weight=ft.FontWeight.BOLD),
-                                keywords_column,
-                                ft.Container(expand=True),
-                                ft.Row(
-                                    [
-                                        ft.OutlinedButton(
-                                            "View CV",
-                                            icon=ft.Icons.PICTURE_AS_PDF_OUTLINED,
-                                            on_click=lambda e, did=detail_id: on_view_cv_click(
-                                                e, did
-                                            ),
-                                        ),
-                                        ft.FilledButton(
-                                            "View Summary",
-                                            icon=ft.Icons.VISIBILITY_OUTLINED,
-                                            on_click=partial(
-                                                lambda _, did: page.go(
-                                                    f"/summary/{did}"
-                                                ),
-                                                did=detail_id,
-                                            ),
-                                        ),
-                                    ],
-                                    alignment=ft.MainAxisAlignment.END,
-                                ),
-                            ],
-                            spacing=8,
-                        ),
-                        padding=20,
-                        border_radius=10,
-                        width=card_width,
-                    )
-                )
-                i = i + 1
-                results_view.controls.append(card)
+    def _card_width(num_results):
+        effective_columns = min(GRID_COLUMNS, num_results)
+        effective_columns = max(1, effective_columns)
+        # page.width is None until the first layout
+        return _compute_card_width(int(page.width or DEFAULT_PAGE_WIDTH), effective_columns)
+
+    def _search_results(response_data):
+        return (response_data or {}).get("search_results") or []
+
+    def _show_results(response_data, cards, cached=False):
+        """Attach already built cards (or the empty state) to the results row.
+
+        Only mutates controls; the caller sends them with a single page.update().
+        A cached response is marked as such, since its timings are from the
+        original search.
+        """
+        results_view.controls.clear()
+        load_more_button.visible = len(cards) < len(_search_results(response_data))
+        if cards:
+            summary_text.value = response_data.get("summary", "No performance summary.")
+            if cached:
+                summary_text.value += " (cached)"
+            results_view.controls.extend(cards)
         else:
             results_view.controls.append(
                 ft.Column(
@@ -338,75 +295,163 @@ def build_main_view(
                         ft.Text(
                             "No results found.",
                             style=ft.TextThemeStyle.HEADLINE_SMALL,
-                            color=ft.Colors.BLUE_GREY_400,
+                            color=_COLOR_MUTED,
                         ),
                     ],
                     horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 )
             )
 
-        page.update()
+    # Snack bars hang off the page itself, so only they need a full page.update()
+    snack_state = {"pending": False}
 
-    def handle_search(e):
-        kw, algo, top_n = (
-            keywords_input.value,
-            algo_dropdown.value,
-            int(top_n_input.value),
-        )
+    def _show_snack_bar(message, **kwargs):
+        page.snack_bar = ft.SnackBar(ft.Text(message), **kwargs)
+        page.snack_bar.open = True
+        snack_state["pending"] = True
+
+    async def handle_search(e):
+        # Re-entrancy guard: a second click while a search is in flight is
+        # dropped instead of starting a duplicate request.
+        if search_button.disabled:
+            return
+        search_button.disabled = True
+        try:
+            await _run_search()
+        finally:
+            loading_container.visible = False
+            results_view.visible = True
+            search_button.disabled = False
+            if snack_state["pending"]:
+                snack_state["pending"] = False
+                page.update()
+            else:
+                page.update(
+                    loading_container,
+                    results_view,
+                    load_more_button,
+                    summary_text,
+                    search_button,
+                )
+
+    async def _run_search():
+        kw, algo = keywords_input.value, algo_dropdown.value
         if not kw:
-            page.snack_bar = ft.SnackBar(
-                ft.Text("Keywords are required."), bgcolor=ft.Colors.ERROR
-            )
-            page.snack_bar.open = True
-            page.update()
+            _show_snack_bar("Keywords are required.", bgcolor=ft.Colors.ERROR)
             return
 
+        # Validate without int() raising on empty / non-numeric input
+        raw_top_n = (top_n_input.value or "").strip()
+        if raw_top_n.isdecimal() and int(raw_top_n) > 0:
+            top_n = int(raw_top_n)
+            if top_n > MAX_TOP_N:
+                # Large result sets slow the backend down for little benefit
+                top_n = MAX_TOP_N
+                top_n_input.value = str(top_n)
+                _show_snack_bar(f"Top N is limited to {MAX_TOP_N}.")
+        else:
+            top_n = DEFAULT_TOP_N_MATCHES
+            top_n_input.value = str(top_n)
+            _show_snack_bar(f"Top N must be a positive number, using {top_n}.")
+
         # Parse keywords - detect if multiple keywords are provided
         keywords_list = [k.strip().lower() for k in kw.split(",") if k.strip()]
         use_multiple_search = len(keywords_list) > 1
 
-        search_button.disabled = True
-        results_view.controls.clear()
-        results_view.controls.append(
-            ft.Container(
-                content=ft.Column(
-                    [ft.ProgressRing(), ft.Text("Searching CVs...")],
-                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    spacing=10,
-                ),
-                alignment=ft.alignment.center,
-                expand=True,
-            )
-        )
+        loading_container.visible = True
+        results_view.visible = False
+        load_more_button.visible = False
         summary_text.value = ""
-        page.update()
-
-        # Use multiple pattern search if multiple keywords are provided
-        if use_multiple_search:
-            response = api_client.search_multiple_patterns(
-                keywords_list, algo, top_n
-            )  # Pass algorithm
-            search_type = "multiple"
+        # Snack bars and the Top N fix-up above are sent by the final
+        # page.update() in handle_search; here only the changed controls go out.
+        page.update(
+            loading_container, results_view, load_more_button, summary_text, search_button
+        )
+
+        search_type = "multiple" if use_multiple_search else "single"
+        cache_key = (
+            search_type,
+            tuple(keywords_list) if use_multiple_search else kw,
+            algo,
+            top_n,
+        )
+        search_cache = search_state["search_cache"]
+        cached = search_cache.get(cache_key)
+        from_cache = (
+            cached is not None and time.monotonic() - cached[0] < SEARCH_CACHE_TTL
+        )
+        if from_cache:
+            search_cache.move_to_end(cache_key)
+            response = cached[1]
         else:
-            response = api_client.search(kw, algo, top_n)
-            search_type = "single"
+            # Use multiple pattern search if multiple keywords are provided
+            if use_multiple_search:
+                response = await api_client.search_multiple_patterns(
+                    keywords_list, algo, top_n
+                )  # Pass algorithm
+            else:
+                response = await api_client.search(kw, algo, top_n)
+
+            # Failed searches are not cached so the next click retries
+            if response is not None:
+                search_cache[cache_key] = (time.monotonic(), response)
+                search_cache.move_to_end(cache_key)
+                if len(search_cache) > SEARCH_CACHE_SIZE:
+                    search_cache.popitem(last=False)
 
         search_state["search_type"] = search_type
         search_state["last_response"] = response
-        _populate_results(response)
-        search_button.disabled = False
-        page.update()
+        search_state["last_cards"] = None
+        # Pooled cards may still be children of results_view, so they are
+        # rebound here on the loop, not on a worker thread; binding one page of
+        # pooled cards is cheap. "Load more" binds the rest on demand.
+        results = _search_results(response)
+        cards = build_cards(
+            results[:PAGE_SIZE],
+            _card_width(len(results)),
+            card_pool,
+            on_view_cv_click,
+            go_to_summary,
+        )
+        search_state["last_cards"] = cards
+        _show_results(response, cards, cached=from_cache)
+
+        _prefetch_summaries(results[:PAGE_SIZE])
+
+    def _prefetch_summaries(results):
+        """Fetches summaries for the shown cards in the background so that
+        "View Summary" is a cache hit."""
+        detail_ids = [r["detail_id"] for r in results if r.get("detail_id") is not None]
+        if detail_ids:
+            page.run_task(api_client.prefetch_summaries, detail_ids)
+
+    def load_more(e):
+        response = search_state["last_response"]
+        cards = search_state["last_cards"]
+        results = _search_results(response)
+        start = len(cards)
+        new_cards = build_cards(
+            results[start : start + PAGE_SIZE],
+            _card_width(len(results)),
+            card_pool,
+            on_view_cv_click,
+            go_to_summary,
+            start=start,
+        )
+        cards.extend(new_cards)
+        results_view.controls.extend(new_cards)
+        load_more_button.visible = len(cards) < len(results)
+        page.update(results_view, load_more_button)
+        _prefetch_summaries(results[start : start + PAGE_SIZE])
 
     search_button.on_click = handle_search
-
-    if search_state.get("last_response"):
-        _populate_results(search_state["last_response"])
+    load_more_button.on_click = load_more
 
     return ft.View(
         "/",
         [
             ft.AppBar(
-                title=ft.Text("CV Analyzer"), bgcolor=ft.Colors.ON_SURFACE_VARIANT
+                title=ft.Text("CV Analyzer"), bgcolor=_COLOR_HEADER
             ),
             ft.Column(
                 [
@@ -435,5 +480,5 @@ def build_main_view(
             ),
         ],
         padding=20,
-        bgcolor=ft.Colors.BLUE_GREY_50,
+        bgcolor=_COLOR_PAGE_BG,
     )